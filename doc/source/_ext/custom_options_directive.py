@@ -18,7 +18,7 @@ def setup(app):
     app.add_domain(SmashModelOptimize)
     app.add_domain(SmashNetAdd)
     app.add_domain(SmashNetCompile)
-    return {"parallel_read_safe": True}
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
 
 
 def _option_required_str(x):
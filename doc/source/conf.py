@@ -58,6 +58,7 @@ autosectionlabel_maxdepth = 1
 pygments_style = "sphinx"
 
 numpydoc_show_class_members = True
+numpydoc_class_members_toctree = False
 
 autosummary_generate = True  # Turn on sphinx.ext.autosummary
 
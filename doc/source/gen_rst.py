@@ -2,20 +2,19 @@ import sys
 import pathlib
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    force = len(args) < len(sys.argv) - 1
+
+    if not args:
         raise IndexError("No file path provided to generate rst file")
 
-    file_path = pathlib.Path(sys.argv[1])
+    file_path = pathlib.Path(args[0])
 
     file_path = file_path.with_suffix(".rst")
 
-    if file_path.exists():
-        exists_input = input("Overwrite existing file ([y]/n) ? ")
-
-        if not exists_input.lower() in ["", "y", "yes"]:
-            exit(0)
-
-    file_path.parent.mkdir(exist_ok=True)
+    if file_path.exists() and not force:
+        print(f"{file_path} already exists, use --force to overwrite it")
+        exit(0)
 
     if file_path.stem == "index":
         rst_label = ".. _" + str(file_path.parent).replace("/", ".") + ":"
@@ -31,9 +30,23 @@ if __name__ == "__main__":
     rst_main_title = file_path.stem.replace("_", " ").capitalize()
     len_rst_main_title = len(rst_main_title)
 
+    content = (
+        rst_label
+        + "\n"
+        + "\n"
+        + "=" * len_rst_main_title
+        + "\n"
+        + rst_main_title
+        + "\n"
+        + "=" * len_rst_main_title
+        + "\n"
+    )
+
+    # % Do not touch an identical file to keep Sphinx incremental build cache
+    if file_path.exists() and file_path.read_text() == content:
+        exit(0)
+
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
     with open(file_path, "w") as f:
-        f.write(rst_label + "\n")
-        f.write("\n")
-        f.write("=" * len_rst_main_title + "\n")
-        f.write(rst_main_title + "\n")
-        f.write("=" * len_rst_main_title + "\n")
+        f.write(content)
@@ -29,7 +29,6 @@ setup(
         "f90wrap",
         "numpy>=1.13",
         "pandas",
-        "matplotlib",
         "h5py",
         "tqdm",
         "gdal",
@@ -38,5 +37,6 @@ setup(
         "SALib>=1.4.5",
         "terminaltables",
     ],
+    extras_require={"plot": ["matplotlib"]},
     zip_safe=False,
 )
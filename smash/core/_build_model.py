@@ -52,34 +52,47 @@ def _standardize_setup(setup: SetupDT):
     Check every SetupDT error/warning exception
     """
 
-    setup.structure = setup.structure.lower()
-    if setup.structure not in STRUCTURE_NAME:
-        raise ValueError(
-            f"Unknown structure '{setup.structure}'. Choices: {STRUCTURE_NAME}"
-        )
-
-    if setup.dt < 0:
+    # % Character attributes are decoded by the f90wrap getter at each access,
+    # % get them once
+    structure = setup.structure.lower()
+    start_time = setup.start_time
+    end_time = setup.end_time
+    qobs_directory = setup.qobs_directory
+    prcp_directory = setup.prcp_directory
+    prcp_format = setup.prcp_format
+    pet_directory = setup.pet_directory
+    pet_format = setup.pet_format
+    descriptor_directory = setup.descriptor_directory
+    descriptor_format = setup.descriptor_format
+
+    setup.structure = structure
+    if structure not in STRUCTURE_NAME:
+        raise ValueError(f"Unknown structure '{structure}'. Choices: {STRUCTURE_NAME}")
+
+    dt = setup.dt
+
+    if dt < 0:
         raise ValueError("argument dt is lower than 0")
 
-    if not setup.dt in [900, 3_600, 86_400]:
+    if not dt in [900, 3_600, 86_400]:
         warnings.warn(
             "argument dt is not set to a classical value (900, 3600, 86400 seconds)",
             UserWarning,
         )
 
-    if setup.start_time == "...":
+    if start_time == "...":
         raise ValueError("argument start_time is not defined")
 
-    if setup.end_time == "...":
+    if end_time == "...":
         raise ValueError("argument end_time is not defined")
 
     try:
-        st = pd.Timestamp(setup.start_time)
+        st = pd.Timestamp(start_time)
     except:
         raise ValueError("argument start_time is not a valid date")
 
     try:
-        et = pd.Timestamp(setup.end_time)
+        et = pd.Timestamp(end_time)
     except:
         raise ValueError("argument end_time is not a valid date")
 
@@ -88,87 +101,93 @@ def _standardize_setup(setup: SetupDT):
             "argument end_time is a date earlier to or equal to argument start_time"
         )
 
-    if setup.read_qobs and setup.qobs_directory == "...":
+    read_qobs = setup.read_qobs
+
+    if read_qobs and qobs_directory == "...":
         raise ValueError("argument read_qobs is True and qobs_directory is not defined")
 
-    if setup.read_qobs and not os.path.exists(setup.qobs_directory):
+    if read_qobs and not os.path.exists(qobs_directory):
         raise FileNotFoundError(
             errno.ENOENT,
             os.strerror(errno.ENOENT),
-            setup.qobs_directory,
+            qobs_directory,
         )
 
-    if setup.read_prcp and setup.prcp_directory == "...":
+    read_prcp = setup.read_prcp
+
+    if read_prcp and prcp_directory == "...":
         raise ValueError("argument read_prcp is True and prcp_directory is not defined")
 
-    if setup.read_prcp and not os.path.exists(setup.prcp_directory):
+    if read_prcp and not os.path.exists(prcp_directory):
         raise FileNotFoundError(
             errno.ENOENT,
             os.strerror(errno.ENOENT),
-            setup.prcp_directory,
+            prcp_directory,
         )
 
-    if setup.prcp_format not in INPUT_DATA_FORMAT:
+    if prcp_format not in INPUT_DATA_FORMAT:
         raise ValueError(
-            f"Unknown prcp_format '{setup.prcp_format}'. Choices: {INPUT_DATA_FORMAT}"
+            f"Unknown prcp_format '{prcp_format}'. Choices: {INPUT_DATA_FORMAT}"
         )
 
     if setup.prcp_conversion_factor < 0:
         raise ValueError("argument prcp_conversion_factor is lower than 0")
 
-    if setup.read_pet and setup.pet_directory == "...":
+    read_pet = setup.read_pet
+
+    if read_pet and pet_directory == "...":
         raise ValueError("argument read_pet is True and pet_directory is not defined")
 
-    if setup.read_pet and not os.path.exists(setup.pet_directory):
+    if read_pet and not os.path.exists(pet_directory):
         raise FileNotFoundError(
             errno.ENOENT,
             os.strerror(errno.ENOENT),
-            setup.pet_directory,
+            pet_directory,
         )
 
-    if setup.pet_format not in INPUT_DATA_FORMAT:
+    if pet_format not in INPUT_DATA_FORMAT:
         raise ValueError(
-            f"Unknown pet_format '{setup.pet_format}'. Choices: {INPUT_DATA_FORMAT}"
+            f"Unknown pet_format '{pet_format}'. Choices: {INPUT_DATA_FORMAT}"
         )
 
     if setup.pet_conversion_factor < 0:
         raise ValueError("argument pet_conversion_factor is lower than 0")
 
-    if setup.read_descriptor and setup.descriptor_directory == "...":
+    read_descriptor = setup.read_descriptor
+
+    if read_descriptor and descriptor_directory == "...":
         raise ValueError(
             "argument read_descriptor is True and descriptor_directory is not defined"
         )
 
-    if setup.read_descriptor and not os.path.exists(setup.descriptor_directory):
+    if read_descriptor and not os.path.exists(descriptor_directory):
         raise FileNotFoundError(
             errno.ENOENT,
             os.strerror(errno.ENOENT),
-            setup.descriptor_directory,
+            descriptor_directory,
         )
 
-    if setup.read_descriptor and setup._nd == 0:
+    if read_descriptor and setup._nd == 0:
         raise ValueError(
             "argument read_descriptor is True and descriptor_name is not defined"
         )
 
-    if setup.descriptor_format not in INPUT_DATA_FORMAT:
+    if descriptor_format not in INPUT_DATA_FORMAT:
         raise ValueError(
-            f"Unknown descriptor_format '{setup.descriptor_format}'. Choices: {INPUT_DATA_FORMAT}"
+            f"Unknown descriptor_format '{descriptor_format}'. Choices: {INPUT_DATA_FORMAT}"
         )
 
+    return st, et
+
 
 def _build_setup(setup: SetupDT):
     """
     Build setup
     """
 
-    _standardize_setup(setup)
-
-    st = pd.Timestamp(setup.start_time)
+    st, et = _standardize_setup(setup)
 
-    et = pd.Timestamp(setup.end_time)
-
-    setup._ntime_step = (et - st).total_seconds() / setup.dt
+    setup._ntime_step = (et - st).total_seconds() // setup.dt
 
 
 def _standardize_mesh(setup: SetupDT, mesh: MeshDT):
@@ -191,10 +210,11 @@ def _standardize_mesh(setup: SetupDT, mesh: MeshDT):
     if mesh.ymax < 0:
         raise ValueError("argument ymax of MeshDT is lower than 0")
 
-    if np.all(mesh.flwdir == -99):
+    # % np.any stops at the first valid cell where np.all(== -99) has to reach it too
+    if not np.any(mesh.flwdir != -99):
         raise ValueError("argument flwdir of MeshDT contains only NaN value")
 
-    if np.all(mesh.flwacc == -99):
+    if not np.any(mesh.flwacc != -99):
         raise ValueError("argument flwacc of MeshDT contains only NaN value")
 
 
@@ -209,7 +229,33 @@ def _build_mesh(setup: SetupDT, mesh: MeshDT):
         compute_rowcol_to_ind_sparse(mesh)  # % Fortran subroutine mw_routine
 
 
-def _build_input_data(setup: SetupDT, mesh: MeshDT, input_data: Input_DataDT):
+def _build_date_range(setup: SetupDT) -> pd.DatetimeIndex:
+    """
+    Build the simulated time steps (the start time is not simulated)
+    """
+
+    return pd.date_range(
+        start=setup.start_time, end=setup.end_time, freq=f"{int(setup.dt)}s"
+    )[1:]
+
+
+def _build_day_index(date_range: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Day index (starting at 1) of each time step, incremented at each new day
+    """
+
+    # % Days since epoch, whatever the time unit of the index (ns, us, ms or s)
+    days = date_range.to_numpy().astype("datetime64[D]").astype(np.int64)
+
+    return np.cumsum(np.r_[True, days[1:] != days[:-1]], dtype=np.int64)
+
+
+def _build_input_data(
+    setup: SetupDT,
+    mesh: MeshDT,
+    input_data: Input_DataDT,
+    date_range: pd.DatetimeIndex | None = None,
+):
     """
     Build input_data
     """
@@ -217,11 +263,15 @@ def _build_input_data(setup: SetupDT, mesh: MeshDT, input_data: Input_DataDT):
     if setup.read_qobs:
         _read_qobs(setup, mesh, input_data)
 
+    # % Shared by both forcing readers
+    if date_range is None and (setup.read_prcp or setup.read_pet):
+        date_range = _build_date_range(setup)
+
     if setup.read_prcp:
-        _read_prcp(setup, mesh, input_data)
+        _read_prcp(setup, mesh, input_data, date_range)
 
     if setup.read_pet:
-        _read_pet(setup, mesh, input_data)
+        _read_pet(setup, mesh, input_data, date_range)
 
     if setup.mean_forcing:
         compute_mean_forcing(setup, mesh, input_data)  # % Fortran subroutine mw_routine
@@ -231,21 +281,19 @@ def _build_input_data(setup: SetupDT, mesh: MeshDT, input_data: Input_DataDT):
 
 
 def _build_parameters(
-    setup: SetupDT, mesh: MeshDT, input_data: Input_DataDT, parameters: ParametersDT
+    setup: SetupDT,
+    mesh: MeshDT,
+    input_data: Input_DataDT,
+    parameters: ParametersDT,
+    date_range: pd.DatetimeIndex | None = None,
 ):
     if STRUCTURE_ADJUST_CI[setup.structure] and setup.dt < 86_400:
         # % Handle dates with Python before calling Fortran subroutine
-        date_range = pd.date_range(
-            start=setup.start_time, end=setup.end_time, freq=f"{int(setup.dt)}s"
-        )[1:].strftime("%Y%m%d")
-
-        n = 1
-        day_index = np.ones(shape=len(date_range), dtype=np.int64)
-        for i in range(1, len(date_range)):
-            if date_range[i] != date_range[i - 1]:
-                n += 1
+        if date_range is None:
+            date_range = _build_date_range(setup)
 
-            day_index[i] = n
+        day_index = _build_day_index(date_range)
+        n = int(day_index[-1])
 
         adjust_interception_store(
             setup, mesh, input_data, parameters, n, day_index
@@ -152,6 +152,6 @@ LAYER_NAME = ["dense", "activation", "scale", "dropout"]
 ### GENERATE SAMPLES ###
 ########################
 
-SAMPLE_GENERATORS = ["uniform", "normal", "gaussian"]
+SAMPLE_GENERATORS = ["uniform", "normal", "gaussian", "lhs"]
 
 PROBLEM_KEYS = ["num_vars", "names", "bounds"]
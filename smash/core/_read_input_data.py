@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from smash.tools.raster_handler import gdal_read_windowed_raster
 
-from smash.core.utils import sparse_matrix_to_vector
-
 from smash.core._constant import RATIO_PET_HOURLY
 
 from typing import TYPE_CHECKING
@@ -14,8 +12,10 @@ if TYPE_CHECKING:
     from smash.solver._mwd_input_data import Input_DataDT
 
 import os
+import re
 import warnings
-import glob
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 import pandas as pd
 import numpy as np
@@ -24,13 +24,22 @@ import datetime
 
 def _read_qobs(setup: SetupDT, mesh: MeshDT, input_data: Input_DataDT):
     st = pd.Timestamp(setup.start_time)
+    dt = setup.dt
+    qobs_directory = setup.qobs_directory
+
+    # % Walk the directory once and match the catchment codes on the file basenames
+    files = _list_files(qobs_directory, "*.csv")
+    basenames = [os.path.basename(f) for f in files]
+
+    # % Gauge files usually share the same header date, parse each header once
+    time_diffs = {}
 
     for i, c in enumerate(mesh.code):
-        path = glob.glob(f"{setup.qobs_directory}/**/*{c}*.csv", recursive=True)
+        path = [f for f, b in zip(files, basenames) if c in b]
 
         if len(path) == 0:
             warnings.warn(
-                f"No observed discharge file for catchment {c} in recursive root directory {setup.qobs_directory}"
+                f"No observed discharge file for catchment {c} in recursive root directory {qobs_directory}"
             )
 
         elif len(path) > 1:
@@ -40,57 +49,99 @@ def _read_qobs(setup: SetupDT, mesh: MeshDT, input_data: Input_DataDT):
 
         else:
             with open(path[0], "r") as f:
-                
+                header_string = f.readline()
+
+            time_diff = time_diffs.get(header_string)
+
+            if time_diff is None:
                 try:
-                    
-                    header_string=f.readline()
                     header = pd.Timestamp(header_string)
-                    
+
                 except:
-                    
                     raise ValueError(
                         f"Bad header {header_string} string when reading file '{path[0]}'. '{header_string}' may not be a date."
                     )
-                
-                time_diff = int((st - header).total_seconds() / setup.dt) + 1
 
-                if time_diff > 0:
-                    k = 0
+                time_diff = int((st - header).total_seconds() / dt) + 1
 
-                    for j, line in enumerate(f):
-                        if j >= time_diff:
-                            try:
-                                input_data.qobs[i, k] = float(line)
+                time_diffs[header_string] = time_diff
 
-                                k += 1
+            # % Index of the first time step to fill in and number of lines to skip
+            # % after the header (the first time step is not simulated)
+            k = max(0, -time_diff)
+            skiprows = 1 + max(0, time_diff)
 
-                            except:
-                                break
-                else:
-                    k = -time_diff
-
-                    for line in f:
-                        try:
-                            input_data.qobs[i, k] = float(line)
+            nrows = input_data.qobs.shape[1] - k
 
-                            k += 1
+            if nrows > 0:
+                # % Read raw strings so that parse failures can be told apart from
+                # % literal nan values
+                try:
+                    raw = pd.read_csv(
+                        path[0],
+                        header=None,
+                        usecols=[0],
+                        skiprows=skiprows,
+                        nrows=nrows,
+                        skip_blank_lines=False,
+                        dtype=str,
+                        na_filter=False,
+                        engine="c",
+                    ).iloc[:, 0]
+
+                except pd.errors.EmptyDataError:
+                    raw = pd.Series([], dtype=str)
+
+                qobs = pd.to_numeric(raw, errors="coerce").to_numpy(dtype=np.float32)
+
+                # % Stop reading at the first value that float can not parse,
+                # % literal nan values are stored and reading goes on
+                for j in np.flatnonzero(np.isnan(qobs)):
+                    try:
+                        qobs[j] = float(raw.iat[j])
+
+                    except ValueError:
+                        qobs = qobs[:j]
+                        break
+
+                input_data.qobs[i, k : k + qobs.size] = qobs
+
+
+# % Recursively list the files matching pattern in directory with a single walk (sorted)
+# % Equivalent to sorted(glob.glob(f"{directory}/**/{pattern}", recursive=True))
+def _list_files(directory: str, pattern: str) -> list[str]:
+    files = []
+
+    for root, dirs, filenames in os.walk(directory, followlinks=True):
+        # % Hidden directories and files are not matched by glob
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+
+        files.extend(
+            os.path.join(root, f)
+            for f in fnmatch.filter(filenames, pattern)
+            if not f.startswith(".")
+        )
 
-                        except:
-                            break
+    return sorted(files)
 
 
 # % Adjust left files (sorted by date - only works if files have the same name)
 def _adjust_left_files(files: list[str], date_range: pd.Timestamp):
+    basenames = [os.path.basename(f) for f in files]
+
     n = 0
     ind = -1
     while ind == -1:
-        ind = _index_containing_substring(files, date_range[n].strftime("%Y%m%d%H%M"))
+        ind = _index_containing_substring(
+            basenames, date_range[n].strftime("%Y%m%d%H%M")
+        )
 
         n += 1
 
     return files[ind:]
 
 
+# % Only the file names (basenames) must be given, to avoid matching dates in directories
 def _index_containing_substring(the_list: list, substring: str):
     for i, s in enumerate(the_list):
         if substring in s:
@@ -98,88 +149,181 @@ def _index_containing_substring(the_list: list, substring: str):
     return -1
 
 
-def _split_date(date_datetime):
-    
-    date_strf = date_datetime.strftime("%Y%m%d%H%M")
-    
-    year=date_strf[0:4]
-    month=date_strf[4:6]
-    day=date_strf[6:8]
-    
-    return year,month,day
-
-
-def _list_prcp_file(setup):
-    
-    datetime_date_start=datetime.datetime.fromisoformat(setup.start_time)
-    datetime_date_end=datetime.datetime.fromisoformat(setup.end_time)
-    
-    if datetime_date_end<datetime_date_start:
-        raise ValueError(
-            f"Cannot list precipitation file because date_end<date_start."
+# % Map each date token of length date_len found in the file names to the file path
+# % (sorted by date - the first file found is kept)
+def _build_files_date_map(
+    files: list[str], basenames: list[str], date_len: int
+) -> dict[str, str]:
+    regex = re.compile(rf"\d{{{date_len}}}")
+
+    files_date_map = {}
+
+    for f, bn in zip(files, basenames):
+        for date_strf in regex.findall(bn):
+            files_date_map.setdefault(date_strf, f)
+
+    return files_date_map
+
+
+def _get_file_from_date(
+    files_date_map: dict, files: list[str], basenames: list[str], date_strf: str
+):
+    path = files_date_map.get(date_strf)
+
+    # % Fall back to substring search if the date is not found in the file names
+    if path is None:
+        ind = _index_containing_substring(basenames, date_strf)
+
+        if ind != -1:
+            path = files[ind]
+
+    return path
+
+
+# % (row, col) indices of the sparse storage, same order as sparse_matrix_to_vector
+# % (active cells following the solver path)
+def _get_sparse_rowcol(mesh: MeshDT) -> tuple[np.ndarray, np.ndarray]:
+    # % Python index (-100 if not defined in the path)
+    row, col = mesh.path
+
+    mask = (row >= 0) & (col >= 0)
+    row, col = row[mask], col[mask]
+
+    mask = mesh.active_cell[row, col] == 1
+
+    return row[mask], col[mask]
+
+
+# % Read windowed rasters concurrently (GDAL releases the GIL while reading) and yield
+# % the converted arrays in the same order as paths (None if the path is None)
+def _read_windowed_rasters(paths: list, mesh: MeshDT, conversion_factor: float):
+    def _read(path):
+        if path is None:
+            return None
+
+        matrix = gdal_read_windowed_raster(
+            filename=path, smash_mesh=mesh, band=1, lacuna=-99.0
         )
-    
-    list_file=list()
-    
-    s_year,s_month,s_day=_split_date(datetime_date_start)
-    e_year,e_month,e_day=_split_date(datetime_date_end)
-    
-    if int(e_year)>int(s_year):
-        
-        for yy in range(int(s_year),int(e_year)+1):
-            list_file=list_file+(glob.glob(f"{setup.prcp_directory}/{yy:04n}/**/*{setup.prcp_format}*", recursive=True))
-    
-    elif int(e_month)>int(s_month):
-        
-        for mm in range(int(s_month),int(e_month)+1):
-            
-            list_file=list_file+(glob.glob(f"{setup.prcp_directory}/{s_year}/{mm:02n}/**/*{setup.prcp_format}*", recursive=True))
-        
-    elif int(e_day)>int(s_day):
-        
-        for dd in range(int(s_day),int(e_day)+1):
-            list_file=list_file+(glob.glob(f"{setup.prcp_directory}/{s_year}/{s_month}/{dd:02n}/*{setup.prcp_format}*", recursive=True))
-    
-    else:
-        
-        list_file=list_file+(glob.glob(f"{setup.prcp_directory}/{s_year}/{s_month}/{s_day}/*{setup.prcp_format}*", recursive=True))
-    
+
+        # % In place conversion, the array returned by the reader is owned here
+        matrix *= conversion_factor
+
+        return matrix
+
+    max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+    # % Submit by chunks to bound the number of arrays held in memory
+    chunk_size = 4 * max_workers
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for ind in range(0, len(paths), chunk_size):
+            yield from executor.map(_read, paths[ind : ind + chunk_size])
+
+
+# % List the precipitation files stored in YYYY/MM/DD directories with a single walk,
+# % only descending into the year, month and day directories covering the simulation
+def _list_prcp_file(setup: SetupDT) -> list[str]:
+    datetime_date_start = datetime.datetime.fromisoformat(setup.start_time)
+    datetime_date_end = datetime.datetime.fromisoformat(setup.end_time)
+
+    if datetime_date_end < datetime_date_start:
+        raise ValueError(f"Cannot list precipitation file because date_end<date_start.")
+
+    days = pd.date_range(
+        start=datetime_date_start.date(), end=datetime_date_end.date(), freq="D"
+    )
+
+    valid_dirs = set()
+
+    for fmt in ("%Y", "%Y/%m", "%Y/%m/%d"):
+        valid_dirs.update(days.strftime(fmt))
+
+    pattern = f"*{setup.prcp_format}*"
+
+    list_file = []
+
+    for root, dirs, filenames in os.walk(setup.prcp_directory, followlinks=True):
+        rel_root = os.path.relpath(root, setup.prcp_directory).replace(os.sep, "/")
+
+        depth = 0 if rel_root == "." else rel_root.count("/") + 1
+
+        # % Hidden directories and files are not matched by glob
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+
+        if depth < 3:
+            # % Directories are matched on their path relative to prcp_directory
+            # % (e.g. "2014", "2014/09" or "2014/09/15")
+            prefix = "" if depth == 0 else f"{rel_root}/"
+
+            dirs[:] = [d for d in dirs if f"{prefix}{d}" in valid_dirs]
+
+        else:
+            list_file.extend(
+                os.path.join(root, f)
+                for f in fnmatch.filter(filenames, pattern)
+                if not f.startswith(".")
+            )
+
     return sorted(list_file)
 
 
-def _read_prcp(setup: SetupDT, mesh: MeshDT, input_data: Input_DataDT):
-    
-    date_range = pd.date_range(
-        start=setup.start_time,
-        end=setup.end_time,
-        freq=f"{int(setup.dt)}s",
-    )[1:]
+def _read_prcp(
+    setup: SetupDT,
+    mesh: MeshDT,
+    input_data: Input_DataDT,
+    date_range: pd.DatetimeIndex | None = None,
+):
+    if date_range is None:
+        date_range = pd.date_range(
+            start=setup.start_time,
+            end=setup.end_time,
+            freq=f"{int(setup.dt)}s",
+        )[1:]
 
     if setup.prcp_yyyymmdd_access:
-        
-        files=_list_prcp_file(setup)
-        
+
+        files = _list_prcp_file(setup)
+
         if setup.prcp_format == "tif":
             files = _adjust_left_files(files, date_range)
-        
-    else :
-        
+
+    else:
+
         if setup.prcp_format == "tif":
-            files = sorted(glob.glob(f"{setup.prcp_directory}/**/*tif*", recursive=True))
+            files = _list_files(setup.prcp_directory, "*tif*")
 
             files = _adjust_left_files(files, date_range)
 
         # % WIP
         elif setup.prcp_format == "nc":
-            files = sorted(glob.glob(f"{setup.prcp_directory}/**/*nc", recursive=True))
-
-    for i, date in enumerate(tqdm(date_range, desc="</> Reading precipitation")):
-        date_strf = date.strftime("%Y%m%d%H%M")
-            
-        ind = _index_containing_substring(files, date_strf)
-        
-        if ind == -1:
-            if setup.sparse_storage:
+            files = _list_files(setup.prcp_directory, "*nc")
+
+    basenames = [os.path.basename(f) for f in files]
+
+    files_date_map = _build_files_date_map(files, basenames, 12)
+
+    # % Vectorized formatting of the date keys
+    paths = [
+        _get_file_from_date(files_date_map, files, basenames, date_strf)
+        for date_strf in date_range.strftime("%Y%m%d%H%M")
+    ]
+
+    matrices = _read_windowed_rasters(paths, mesh, setup.prcp_conversion_factor)
+
+    sparse_storage = setup.sparse_storage
+
+    if sparse_storage:
+        sparse_rowcol = _get_sparse_rowcol(mesh)
+
+    for i, (date, matrix) in enumerate(
+        tqdm(
+            zip(date_range, matrices),
+            total=len(date_range),
+            desc="</> Reading precipitation",
+        )
+    ):
+        if matrix is None:
+            if sparse_storage:
                 input_data.sparse_prcp[:, i] = -99.0
 
             else:
@@ -188,44 +332,47 @@ def _read_prcp(setup: SetupDT, mesh: MeshDT, input_data: Input_DataDT):
             warnings.warn(f"Missing precipitation file for date {date}")
 
         else:
-            matrix = (
-                gdal_read_windowed_raster(
-                    filename=files[ind], smash_mesh=mesh, band=1, lacuna=-99.0
-                )
-                * setup.prcp_conversion_factor
-            )
-
-            if setup.sparse_storage:
-                input_data.sparse_prcp[:, i] = sparse_matrix_to_vector(mesh, matrix)
+            if sparse_storage:
+                input_data.sparse_prcp[:, i] = matrix[sparse_rowcol]
 
             else:
                 input_data.prcp[..., i] = matrix
 
-            files.pop(ind)
 
+def _read_pet(
+    setup: SetupDT,
+    mesh: MeshDT,
+    input_data: Input_DataDT,
+    date_range: pd.DatetimeIndex | None = None,
+):
+    dt = setup.dt
+    sparse_storage = setup.sparse_storage
 
-def _read_pet(setup: SetupDT, mesh: MeshDT, input_data: Input_DataDT):
-    date_range = pd.date_range(
-        start=setup.start_time,
-        end=setup.end_time,
-        freq=f"{int(setup.dt)}s",
-    )[1:]
+    if sparse_storage:
+        sparse_rowcol = _get_sparse_rowcol(mesh)
+
+    if date_range is None:
+        date_range = pd.date_range(
+            start=setup.start_time,
+            end=setup.end_time,
+            freq=f"{int(dt)}s",
+        )[1:]
 
     if setup.pet_format == "tif":
-        files = sorted(glob.glob(f"{setup.pet_directory}/**/*tif*", recursive=True))
+        files = _list_files(setup.pet_directory, "*tif*")
 
         if not setup.daily_interannual_pet:
             files = _adjust_left_files(files, date_range)
 
     elif setup.pet_format == "nc":
-        files = sorted(glob.glob(f"{setup.pet_directory}/**/*nc", recursive=True))
+        files = _list_files(setup.pet_directory, "*nc")
 
     if setup.daily_interannual_pet:
         leap_year_days = pd.date_range(
             start="202001010000", end="202012310000", freq="1D"
         )
-        nstep_per_day = int(86_400 / setup.dt)
-        hourly_ratio = 3_600 / setup.dt
+        nstep_per_day = int(86_400 / dt)
+        hourly_ratio = 3_600 / dt
 
         if hourly_ratio >= 1:
             ratio = np.repeat(RATIO_PET_HOURLY, hourly_ratio) / hourly_ratio
@@ -233,69 +380,87 @@ def _read_pet(setup: SetupDT, mesh: MeshDT, input_data: Input_DataDT):
         else:
             ratio = np.sum(RATIO_PET_HOURLY.reshape(-1, int(1 / hourly_ratio)), axis=1)
 
-        for i, day in enumerate(
-            tqdm(leap_year_days, desc="</> Reading daily interannual pet")
-        ):
-            if day.day_of_year in date_range.day_of_year:
-                day_strf = day.strftime("%m%d")
+        basenames = [os.path.basename(f) for f in files]
 
-                ind = _index_containing_substring(files, day_strf)
+        files_date_map = _build_files_date_map(files, basenames, 4)
 
-                ind_day = np.where(day.day_of_year == date_range.day_of_year)
+        # % Time step indices grouped by day of year
+        ind_day_of_year = (
+            pd.Series(np.arange(date_range.size))
+            .groupby(date_range.day_of_year)
+            .indices
+        )
 
-                if ind == -1:
-                    if setup.sparse_storage:
-                        input_data.sparse_pet[:, ind_day] = -99.0
+        # % Index of each time step within its day and whether it falls on a
+        # % multiple of dt from midnight (i.e. has an associated pet ratio)
+        sec_in_day = (date_range - date_range.normalize()).total_seconds().to_numpy()
+        step_in_day = (sec_in_day // dt).astype(np.int64)
+        match_step = (sec_in_day % dt == 0) & (step_in_day < nstep_per_day)
 
-                    else:
-                        input_data.pet[..., ind_day] = -99.0
+        days = [day for day in leap_year_days if day.day_of_year in ind_day_of_year]
 
-                    warnings.warn(
-                        f"Missing daily interannual pet file for date {day_strf}"
-                    )
+        paths = [
+            _get_file_from_date(files_date_map, files, basenames, day.strftime("%m%d"))
+            for day in days
+        ]
 
-                else:
-                    subset_date_range = date_range[ind_day]
+        matrices = _read_windowed_rasters(paths, mesh, setup.pet_conversion_factor)
 
-                    matrix = (
-                        gdal_read_windowed_raster(
-                            filename=files[ind], smash_mesh=mesh, band=1, lacuna=-99.0
-                        )
-                        * setup.pet_conversion_factor
-                    )
+        for day, matrix in tqdm(
+            zip(days, matrices),
+            total=len(days),
+            desc="</> Reading daily interannual pet",
+        ):
+            ind_day = ind_day_of_year[day.day_of_year]
+
+            if matrix is None:
+                if sparse_storage:
+                    input_data.sparse_pet[:, ind_day] = -99.0
 
-                    if setup.sparse_storage:
-                        vector = sparse_matrix_to_vector(mesh, matrix)
+                else:
+                    input_data.pet[..., ind_day] = -99.0
+
+                warnings.warn(
+                    f"Missing daily interannual pet file for date {day.strftime('%m%d')}"
+                )
 
-                    for j in range(nstep_per_day):
-                        step = day + j * datetime.timedelta(seconds=setup.dt)
+            else:
+                ind_step = ind_day[match_step[ind_day]]
 
-                        ind_step = subset_date_range.indexer_at_time(step)
+                ratio_step = ratio[step_in_day[ind_step]]
 
-                        if setup.sparse_storage:
-                            input_data.sparse_pet[:, ind_day[0][ind_step]] = (
-                                np.repeat(vector[:, np.newaxis], len(ind_step), axis=1)
-                                * ratio[j]
-                            )
+                if sparse_storage:
+                    vector = matrix[sparse_rowcol]
 
-                        else:
-                            input_data.pet[..., ind_day[0][ind_step]] = (
-                                np.repeat(
-                                    matrix[..., np.newaxis], len(ind_step), axis=2
-                                )
-                                * ratio[j]
-                            )
+                    input_data.sparse_pet[:, ind_step] = (
+                        vector[:, np.newaxis] * ratio_step
+                    )
 
-                    files.pop(ind)
+                else:
+                    input_data.pet[..., ind_step] = matrix[..., np.newaxis] * ratio_step
 
     else:
-        for i, date in enumerate(tqdm(date_range, desc="</> Reading pet")):
-            date_strf = date.strftime("%Y%m%d%H%M")
+        basenames = [os.path.basename(f) for f in files]
 
-            ind = _index_containing_substring(files, date_strf)
+        files_date_map = _build_files_date_map(files, basenames, 12)
 
-            if ind == -1:
-                if setup.sparse_storage:
+        # % Vectorized formatting of the date keys
+        paths = [
+            _get_file_from_date(files_date_map, files, basenames, date_strf)
+            for date_strf in date_range.strftime("%Y%m%d%H%M")
+        ]
+
+        matrices = _read_windowed_rasters(paths, mesh, setup.pet_conversion_factor)
+
+        for i, (date, matrix) in enumerate(
+            tqdm(
+                zip(date_range, matrices),
+                total=len(date_range),
+                desc="</> Reading pet",
+            )
+        ):
+            if matrix is None:
+                if sparse_storage:
                     input_data.sparse_pet[:, i] = -99.0
 
                 else:
@@ -304,32 +469,28 @@ def _read_pet(setup: SetupDT, mesh: MeshDT, input_data: Input_DataDT):
                 warnings.warn(f"Missing pet file for date {date}")
 
             else:
-                matrix = (
-                    gdal_read_windowed_raster(
-                        filename=files[ind], smash_mesh=mesh, band=1, lacuna=-99.0
-                    )
-                    * setup.pet_conversion_factor
-                )
-
-                if setup.sparse_storage:
-                    input_data.sparse_pet[:, i] = sparse_matrix_to_vector(mesh, matrix)
+                if sparse_storage:
+                    input_data.sparse_pet[:, i] = matrix[sparse_rowcol]
 
                 else:
                     input_data.pet[..., i] = matrix
 
-                files.pop(ind)
-
 
 def _read_descriptor(setup: SetupDT, mesh: MeshDT, input_data: Input_DataDT):
+    descriptor_directory = setup.descriptor_directory
+
+    # % Walk the directory once and match the descriptor names on the file basenames
+    files = _list_files(descriptor_directory, "*.tif*")
+    basenames = [os.path.basename(f) for f in files]
+
     for i, name in enumerate(setup.descriptor_name):
-        path = glob.glob(
-            f"{setup.descriptor_directory}/**/{name}.tif*",
-            recursive=True,
-        )
+        path = [
+            f for f, b in zip(files, basenames) if fnmatch.fnmatch(b, f"{name}.tif*")
+        ]
 
         if len(path) == 0:
             warnings.warn(
-                f"No descriptor file '{name}.tif' in recursive root directory '{setup.descriptor_directory}'"
+                f"No descriptor file '{name}.tif' in recursive root directory '{descriptor_directory}'"
             )
 
         elif len(path) > 1:
@@ -16,7 +16,8 @@ import warnings
 
 import numpy as np
 import pandas as pd
-from scipy.stats import truncnorm
+from scipy.special import ndtr, ndtri
+from scipy.stats import qmc
 
 
 __all__ = ["generate_samples", "SampleResult"]
@@ -169,11 +170,12 @@ class SampleResult(dict):
 
         slc_n = end - start
 
-        slc_names = [key for key in self._problem["names"]] + [
-            "_" + key for key in self._problem["names"]
-        ]
+        names = self._problem["names"]
 
-        slc_dict = {key: self[key][start:end] for key in slc_names}
+        # % Slice the samples then the distributions of each parameter/state (views)
+        slc_dict = {key: self[key][start:end] for key in names}
+
+        slc_dict.update({"_" + key: self["_" + key][start:end] for key in names})
 
         slc_dict["generator"] = self.generator
 
@@ -216,7 +218,7 @@ class SampleResult(dict):
         while ind_start != ind_end:
             yield self.slice(start=ind_start, end=ind_end)
             ind_start = ind_end
-            ind_end = np.minimum(ind_end + by, self.n_sample)
+            ind_end = min(ind_end + by, self.n_sample)
 
     def to_numpy(self, axis=0):
         """
@@ -248,7 +250,10 @@ class SampleResult(dict):
             The SampleResult object as a pandas.DataFrame.
         """
 
-        return pd.DataFrame({k: self[k] for k in self._problem["names"]})
+        # % Single stacked copy, wrapped without copying again by pandas
+        return pd.DataFrame(
+            self.to_numpy(axis=-1), columns=self._problem["names"], copy=False
+        )
 
 
 def generate_samples(
@@ -279,6 +284,7 @@ def generate_samples(
 
         - 'uniform'
         - 'normal' or 'gaussian'
+        - 'lhs' (Latin hypercube sampling within the bounds)
 
     n : int, default 1000
         Number of generated samples.
@@ -356,33 +362,67 @@ def generate_samples(
     if random_state is not None:
         np.random.seed(random_state)
 
-    for i, p in enumerate(problem["names"]):
-        low = problem["bounds"][i][0]
-        upp = problem["bounds"][i][1]
+    if generator == "lhs":
+        # % Latin hypercube design in the unit hypercube, one row per parameter/state
+        unf = qmc.LatinHypercube(d=len(problem["names"]), seed=random_state).random(n).T
+
+    else:
+        # % Draw the uniform samples of all parameters/states at once, row i holds the
+        # % same draws as a per parameter/state call
+        unf = np.random.uniform(size=(len(problem["names"]), n))
 
-        if generator == "uniform":
-            ret_dict[p] = np.random.uniform(low, upp, n)
+    bounds = np.asarray(problem["bounds"], dtype=np.float64).reshape(-1, 2)
+    low = bounds[:, 0]
+    upp = bounds[:, 1]
+
+    if generator in ["uniform", "lhs"]:
+        # % Scale in place, unf becomes the samples buffer
+        unf *= (upp - low)[:, np.newaxis]
+        unf += low[:, np.newaxis]
+
+    for i, p in enumerate(problem["names"]):
+        if generator in ["uniform", "lhs"]:
+            ret_dict[p] = unf[i]
 
-            ret_dict["_" + p] = np.ones(n) / (upp - low)
+            # % Constant density, read-only broadcast view instead of an n-size array
+            ret_dict["_" + p] = np.broadcast_to(1 / (upp[i] - low[i]), n)
 
         elif generator in ["normal", "gaussian"]:
             if coef_std is None:
-                sd = (upp - low) / 3
+                sd = (upp[i] - low[i]) / 3
 
             else:
-                sd = (upp - low) / coef_std
+                sd = (upp[i] - low[i]) / coef_std
 
-            trunc_normal = _get_truncated_normal(mean[p], sd, low, upp)
+            ret_dict[p], ret_dict["_" + p] = _sample_truncated_normal(
+                unf[i], mean[p], sd, low[i], upp[i]
+            )
 
-            ret_dict[p] = trunc_normal.rvs(size=n)
+    return SampleResult(ret_dict)
 
-            ret_dict["_" + p] = trunc_normal.pdf(ret_dict[p])
 
-    return SampleResult(ret_dict)
+def _sample_truncated_normal(
+    u: np.ndarray, mean: float, sd: float, low: float, upp: float
+) -> tuple[np.ndarray, np.ndarray]:
+    # % Inverse transform of uniform draws u to the normal distribution truncated to
+    # % [low, upp] (same samples as scipy.stats.truncnorm), return samples and pdf
+    a = (low - mean) / sd
+    b = (upp - mean) / sd
+
+    # % Use the lower tail of the distribution to keep precision
+    if a < 0:
+        phi_a, phi_b = ndtr(a), ndtr(b)
+        z = ndtri(phi_a + u * (phi_b - phi_a))
+
+    else:
+        phi_a, phi_b = ndtr(-b), ndtr(-a)
+        z = -ndtri(phi_a + (1 - u) * (phi_b - phi_a))
 
+    x = mean + sd * z
 
-def _get_truncated_normal(mean: float, sd: float, low: float, upp: float):
-    return truncnorm((low - mean) / sd, (upp - mean) / sd, loc=mean, scale=sd)
+    pdf = np.exp(-0.5 * z**2) / (np.sqrt(2 * np.pi) * sd * (phi_b - phi_a))
+
+    return x, pdf
 
 
 def _get_bound_constraints(setup: SetupDT, states: bool):
@@ -392,20 +432,30 @@ def _get_bound_constraints(setup: SetupDT, states: bool):
     else:
         control_vector = STRUCTURE_PARAMETERS[setup.structure]
 
+    # % Character arrays are rebuilt by the f90wrap getter at each access, map the
+    # % names to their index once
+    ind_states = {name: i for i, name in enumerate(setup._states_name)}
+    ind_parameters = {name: i for i, name in enumerate(setup._parameters_name)}
+
+    # % Get the bound arrays once (f90wrap array getters) as Python float lists
+    optimize = setup._optimize
+    lb_states = optimize.lb_states.tolist()
+    ub_states = optimize.ub_states.tolist()
+    lb_parameters = optimize.lb_parameters.tolist()
+    ub_parameters = optimize.ub_parameters.tolist()
+
     bounds = []
 
     for name in control_vector:
-        if name in setup._states_name:
-            ind = np.argwhere(setup._states_name == name)
+        if name in ind_states:
+            ind = ind_states[name]
 
-            l = setup._optimize.lb_states[ind].item()
-            u = setup._optimize.ub_states[ind].item()
+            l, u = lb_states[ind], ub_states[ind]
 
         else:
-            ind = np.argwhere(setup._parameters_name == name)
+            ind = ind_parameters[name]
 
-            l = setup._optimize.lb_parameters[ind].item()
-            u = setup._optimize.ub_parameters[ind].item()
+            l, u = lb_parameters[ind], ub_parameters[ind]
 
         bounds += [[l, u]]
 
@@ -423,19 +473,7 @@ def _standardize_problem(problem: dict | None, setup: SetupDT, states: bool):
         problem = _get_bound_constraints(setup, states)
 
     elif isinstance(problem, dict):
-        prl_keys = problem.keys()
-
-        if not all(k in prl_keys for k in PROBLEM_KEYS):
-            raise KeyError(
-                f"Problem dictionary should be defined with required keys {PROBLEM_KEYS}"
-            )
-
-        unk_keys = [k for k in prl_keys if k not in PROBLEM_KEYS]
-
-        if unk_keys:
-            warnings.warn(
-                f"Unknown key(s) found in the problem definition {unk_keys}. Choices: {PROBLEM_KEYS}"
-            )
+        _check_problem_keys(problem)
 
     else:
         raise TypeError("The problem definition must be a dictionary or None")
@@ -443,9 +481,25 @@ def _standardize_problem(problem: dict | None, setup: SetupDT, states: bool):
     return problem
 
 
+def _check_problem_keys(problem: dict):
+    prl_keys = problem.keys()
+
+    if not all(k in prl_keys for k in PROBLEM_KEYS):
+        raise KeyError(
+            f"Problem dictionary should be defined with required keys {PROBLEM_KEYS}"
+        )
+
+    unk_keys = [k for k in prl_keys if k not in PROBLEM_KEYS]
+
+    if unk_keys:
+        warnings.warn(
+            f"Unknown key(s) found in the problem definition {unk_keys}. Choices: {PROBLEM_KEYS}"
+        )
+
+
 def _standardize_generate_samples_args(problem: dict, generator: str, user_mean: dict):
     if isinstance(problem, dict):  # simple check problem
-        _standardize_problem(problem, None, None)
+        _check_problem_keys(problem)
 
     else:
         raise TypeError("problem must be a dictionary")
@@ -15,6 +15,7 @@ from smash.core._build_model import (
     _parse_derived_type,
     _build_setup,
     _build_mesh,
+    _build_date_range,
     _build_input_data,
     _build_parameters,
 )
@@ -128,13 +129,18 @@ class Model(object):
 
             _build_mesh(self.setup, self.mesh)
 
+            # % Simulated time steps, shared by input data and parameters builds
+            date_range = _build_date_range(self.setup)
+
             self.input_data = Input_DataDT(self.setup, self.mesh)
 
-            _build_input_data(self.setup, self.mesh, self.input_data)
+            _build_input_data(self.setup, self.mesh, self.input_data, date_range)
 
             self.parameters = ParametersDT(self.mesh)
 
-            _build_parameters(self.setup, self.mesh, self.input_data, self.parameters)
+            _build_parameters(
+                self.setup, self.mesh, self.input_data, self.parameters, date_range
+            )
 
             self.states = StatesDT(self.mesh)
 
@@ -192,7 +198,7 @@ class Model(object):
 
         else:
             raise TypeError(
-                f"'setup' attribute must be set with {type(SetupDT())}, not {type(value)}"
+                f"'setup' attribute must be set with {SetupDT}, not {type(value)}"
             )
 
     @property
@@ -234,7 +240,7 @@ class Model(object):
 
         else:
             raise TypeError(
-                f"'mesh' attribute must be set with {type(MeshDT())}, not {type(value)}"
+                f"'mesh' attribute must be set with {MeshDT}, not {type(value)}"
             )
 
     @property
@@ -271,7 +277,7 @@ class Model(object):
 
         else:
             raise TypeError(
-                f"'input_data' attribute must be set with {type(Input_DataDT())}, not {type(value)}"
+                f"'input_data' attribute must be set with {Input_DataDT}, not {type(value)}"
             )
 
     @property
@@ -313,7 +319,7 @@ class Model(object):
 
         else:
             raise TypeError(
-                f"'parameters' attribute must be set with {type(ParametersDT())}, not {type(value)}"
+                f"'parameters' attribute must be set with {ParametersDT}, not {type(value)}"
             )
 
     @property
@@ -351,7 +357,7 @@ class Model(object):
 
         else:
             raise TypeError(
-                f"'states' attribute must be set with {type(StatesDT())}, not {type(value)}"
+                f"'states' attribute must be set with {StatesDT}, not {type(value)}"
             )
 
     @property
@@ -389,7 +395,7 @@ class Model(object):
 
         else:
             raise TypeError(
-                f"'output' attribute must be set with {type(OutputDT())}, not {type(value)}"
+                f"'output' attribute must be set with {OutputDT}, not {type(value)}"
             )
 
     @property
@@ -446,7 +452,7 @@ class Model(object):
 
         return copy
 
-    def run(self, inplace: bool = False):
+    def run(self, inplace: bool = False, verbose: bool = True):
         """
         Run the Model.
 
@@ -455,6 +461,9 @@ class Model(object):
         inplace : bool, default False
             If True, perform operation in-place.
 
+        verbose : bool, default True
+            Display information while running.
+
         Returns
         -------
         Model : Model or None
@@ -483,7 +492,8 @@ class Model(object):
         else:
             instance = self.copy()
 
-        print("</> Run Model")
+        if verbose:
+            print("</> Run Model")
 
         cost = np.float32(0)
 
@@ -515,6 +525,7 @@ class Model(object):
         ost: str | pd.Timestamp | None = None,
         ncpu: int = 1,
         return_qsim: bool = False,
+        qsim_directory: str | None = None,
         verbose: bool = True,
     ):
         """
@@ -538,6 +549,16 @@ class Model(object):
         return_qsim : bool, default False
             If True, also return the simulated discharge in the `MultipleRunResult` object.
 
+        qsim_directory : str or None, default None
+            Directory in which to store the simulated discharge when **return_qsim** is True.
+
+            .. note::
+                If not given, the simulated discharge is returned as a `numpy.ndarray` held in memory.
+                Otherwise, it is returned as a `numpy.memmap` backed by an anonymous temporary file
+                created in this directory, which is removed once the array is no longer referenced.
+                This is useful when the simulated discharge does not fit in memory, as long as the
+                directory is on disk and not on a memory based file system (e.g. tmpfs).
+
         verbose : bool, default True
             Display information while computing.
 
@@ -589,7 +610,8 @@ class Model(object):
 
         instance = self.copy()
 
-        print("</> Multiple Run Model")
+        if verbose:
+            print("</> Multiple Run Model")
 
         # % standardize args
         (
@@ -600,6 +622,7 @@ class Model(object):
             wgauge,
             ost,
             ncpu,
+            qsim_directory,
         ) = _standardize_multiple_run_args(
             sample,
             jobs_fun,
@@ -609,6 +632,7 @@ class Model(object):
             wgauge,
             ost,
             ncpu,
+            qsim_directory,
             instance,
         )
 
@@ -622,6 +646,7 @@ class Model(object):
             ost,
             ncpu,
             return_qsim,
+            qsim_directory,
             verbose,
         )
 
@@ -790,7 +815,8 @@ class Model(object):
         else:
             instance = self.copy()
 
-        print("</> Optimize Model")
+        if verbose:
+            print("</> Optimize Model")
 
         # % standardize args
         (
@@ -950,7 +976,8 @@ class Model(object):
         else:
             instance = self.copy()
 
-        print("</> Bayes Estimate Model")
+        if verbose:
+            print("</> Bayes Estimate Model")
 
         # % standardize args
         (
@@ -1152,7 +1179,8 @@ class Model(object):
         else:
             instance = self.copy()
 
-        print("</> Bayes Optimize Model")
+        if verbose:
+            print("</> Bayes Optimize Model")
 
         # % standardize args
         (
@@ -1368,7 +1396,8 @@ class Model(object):
         else:
             instance = self.copy()
 
-        print("</> ANN Optimize Model")
+        if verbose:
+            print("</> ANN Optimize Model")
 
         if net is None:
             use_default_graph = True
@@ -1428,7 +1457,12 @@ class Model(object):
             if not inplace:
                 return instance
 
-    def event_segmentation(self, peak_quant: float = 0.995, max_duration: float = 240):
+    def event_segmentation(
+        self,
+        peak_quant: float = 0.995,
+        max_duration: float = 240,
+        verbose: bool = True,
+    ):
         """
         Compute segmentation information of flood events over all catchments of the Model.
 
@@ -1443,6 +1477,9 @@ class Model(object):
         max_duration: float, default 240
             The expected maximum duration of an event (in hours). If multiple events are detected, their duration may exceed this value.
 
+        verbose: bool, default True
+            Display information while computing.
+
         Returns
         -------
         res : pandas.DataFrame
@@ -1473,7 +1510,8 @@ class Model(object):
         [3 rows x 6 columns]
 
         """
-        print("</> Model Event Segmentation")
+        if verbose:
+            print("</> Model Event Segmentation")
 
         return _event_segmentation(self, peak_quant, max_duration)
 
@@ -1482,6 +1520,7 @@ class Model(object):
         sign: str | list | None = None,
         obs_comp: bool = True,
         event_seg: dict | None = None,
+        verbose: bool = True,
     ):
         """
         Compute continuous or/and flood event signatures of the Model.
@@ -1514,6 +1553,9 @@ class Model(object):
             .. note::
                 If not given in case flood signatures are computed, the default values will be set for these parameters.
 
+        verbose : bool, default True
+            Display information while computing.
+
         Returns
         -------
         res : SignResult
@@ -1550,7 +1592,8 @@ class Model(object):
 
         """
 
-        print("</> Model Signatures")
+        if verbose:
+            print("</> Model Signatures")
 
         cs, es = _standardize_signatures(sign)
 
@@ -1565,6 +1608,7 @@ class Model(object):
         sign: str | list[str] | None = None,
         event_seg: dict | None = None,
         random_state: int | None = None,
+        verbose: bool = True,
     ):
         """
         Compute the first- and total-order variance-based sensitivity (Sobol indices) of spatially uniform hydrological model parameters on the output signatures.
@@ -1617,6 +1661,9 @@ class Model(object):
             .. note::
                 If not given, generates the parameters set with a random seed.
 
+        verbose : bool, default True
+            Display information while computing.
+
         Returns
         -------
         res : SignSensResult
@@ -1654,7 +1701,8 @@ class Model(object):
 
         """
 
-        print("</> Model Signatures Sensitivity")
+        if verbose:
+            print("</> Model Signatures Sensitivity")
 
         instance = self.copy()
 
@@ -1665,12 +1713,12 @@ class Model(object):
         event_seg = _standardize_event_seg_options(event_seg)
 
         res = _signatures_sensitivity(
-            instance, problem, n, cs, es, random_state, **event_seg
+            instance, problem, n, cs, es, random_state, verbose, **event_seg
         )
 
         return res
 
-    def prcp_indices(self):
+    def prcp_indices(self, verbose: bool = True):
         """
         Compute precipitations indices of the Model.
 
@@ -1684,6 +1732,11 @@ class Model(object):
         .. hint::
             See the :ref:`User Guide <user_guide.in_depth.prcp_indices>` for more.
 
+        Parameters
+        ----------
+        verbose : bool, default True
+            Display information while computing.
+
         Returns
         -------
         res : PrcpIndicesResult
@@ -1723,7 +1776,8 @@ class Model(object):
         1.209175
         """
 
-        print("</> Model Precipitation Indices")
+        if verbose:
+            print("</> Model Precipitation Indices")
 
         return _prcp_indices(self)
 
@@ -870,11 +870,15 @@ class StochasticGradientDescent:
         self.w_updt = None
 
     def update(self, w, grad_wrt_w):
+        # % Keep the update arithmetic in the weights precision
+        grad_wrt_w = grad_wrt_w.astype(w.dtype, copy=False)
+
         # If not initialized
         if self.w_updt is None:
-            self.w_updt = np.zeros(np.shape(w))
-        # Use momentum if set
-        self.w_updt = self.momentum * self.w_updt + (1 - self.momentum) * grad_wrt_w
+            self.w_updt = np.zeros_like(w)
+        # Use momentum if set (update the running state in place)
+        self.w_updt *= self.momentum
+        self.w_updt += (1 - self.momentum) * grad_wrt_w
         # Move against the gradient to minimize loss
         return w - self.learning_rate * self.w_updt
 
@@ -910,24 +914,38 @@ class Adam:
         self.eps = 1e-8
         self.m = None
         self.v = None
+        self.t = 0
 
         # Decay rates
         self.b1 = b1
         self.b2 = b2
 
     def update(self, w: np.ndarray, grad_wrt_w: np.ndarray):
+        # % Keep the update arithmetic in the weights precision
+        grad_wrt_w = grad_wrt_w.astype(w.dtype, copy=False)
+
         # If not initialized
         if self.m is None:
-            self.m = np.zeros(np.shape(grad_wrt_w))
-            self.v = np.zeros(np.shape(grad_wrt_w))
+            self.m = np.zeros_like(grad_wrt_w)
+            self.v = np.zeros_like(grad_wrt_w)
+
+        # Update the moment estimates in place
+        self.m *= self.b1
+        self.m += (1 - self.b1) * grad_wrt_w
 
-        self.m = self.b1 * self.m + (1 - self.b1) * grad_wrt_w
-        self.v = self.b2 * self.v + (1 - self.b2) * np.power(grad_wrt_w, 2)
+        self.v *= self.b2
+        self.v += (1 - self.b2) * (grad_wrt_w * grad_wrt_w)
 
-        m_hat = self.m / (1 - self.b1)
-        v_hat = self.v / (1 - self.b2)
+        # Bias correction of the moment estimates at time step t
+        self.t += 1
+        bias_m = 1 - self.b1**self.t
+        bias_v = 1 - self.b2**self.t
 
-        self.w_updt = self.learning_rate * m_hat / (np.sqrt(v_hat) + self.eps)
+        # % Fold the bias corrections into scalars to avoid m_hat and v_hat copies
+        self.w_updt = np.sqrt(self.v / bias_v)
+        self.w_updt += self.eps
+        np.divide(self.m, self.w_updt, out=self.w_updt)
+        self.w_updt *= self.learning_rate / bias_m
 
         return w - self.w_updt
 
@@ -953,11 +971,14 @@ class Adagrad:
         self.eps = 1e-8
 
     def update(self, w: np.ndarray, grad_wrt_w: np.ndarray):
+        # % Keep the update arithmetic in the weights precision
+        grad_wrt_w = grad_wrt_w.astype(w.dtype, copy=False)
+
         # If not initialized
         if self.G is None:
-            self.G = np.zeros(np.shape(w))
+            self.G = np.zeros_like(w)
         # Add the square of the gradient of the loss function at w
-        self.G += np.power(grad_wrt_w, 2)
+        self.G += grad_wrt_w * grad_wrt_w
         # Adaptive gradient with higher learning rate for sparse data
         return w - self.learning_rate * grad_wrt_w / np.sqrt(self.G + self.eps)
 
@@ -988,11 +1009,16 @@ class RMSprop:
         self.rho = rho
 
     def update(self, w: np.ndarray, grad_wrt_w: np.ndarray):
+        # % Keep the update arithmetic in the weights precision
+        grad_wrt_w = grad_wrt_w.astype(w.dtype, copy=False)
+
         # If not initialized
         if self.Eg is None:
-            self.Eg = np.zeros(np.shape(grad_wrt_w))
+            self.Eg = np.zeros_like(grad_wrt_w)
 
-        self.Eg = self.rho * self.Eg + (1 - self.rho) * np.power(grad_wrt_w, 2)
+        # Update the running average in place
+        self.Eg *= self.rho
+        self.Eg += (1 - self.rho) * (grad_wrt_w * grad_wrt_w)
 
         # Divide the learning rate for a weight by a running average of the magnitudes of recent
         # gradients for that weight
@@ -1022,9 +1048,12 @@ def _hcost_prime(
     parameters_bgd: ParametersDT,
     states_bgd: StatesDT,
 ):
+    # % Character arrays are rebuilt by the f90wrap getter at each access, get it once
+    parameters_name = instance.setup._parameters_name
+
     # % Set parameters or states
     for i, name in enumerate(control_vector):
-        if name in instance.setup._parameters_name:
+        if name in parameters_name:
             getattr(instance.parameters, name)[mask] = y[:, i]
 
         else:
@@ -1062,7 +1091,7 @@ def _hcost_prime(
     grad = np.transpose(
         [
             getattr(parameters_b, name)[mask]
-            if name in instance.setup._parameters_name
+            if name in parameters_name
             else getattr(states_b, name)[mask]
             for name in control_vector
         ]
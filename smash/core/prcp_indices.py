@@ -109,16 +109,17 @@ class PrcpIndicesResult(dict):
 
 
 def _prcp_indices(instance: Model) -> PrcpIndicesResult:
-    prcp_indices = np.zeros(
+    prcp_indices = np.full(
         shape=(len(PRCP_INDICES), instance.mesh.ng, instance.setup._ntime_step),
+        fill_value=-1,
         dtype=np.float32,
         order="F",
-    ) - np.float32(1)
+    )
 
     compute_prcp_indices(
         instance.setup, instance.mesh, instance.input_data, prcp_indices
     )
 
-    prcp_indices = np.where(prcp_indices < 0, np.nan, prcp_indices)
+    prcp_indices[prcp_indices < 0] = np.nan
 
     return PrcpIndicesResult(dict(zip(PRCP_INDICES, prcp_indices)))
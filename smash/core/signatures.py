@@ -182,6 +182,22 @@ def _continuous_signatures(p: np.ndarray, q: np.ndarray, list_signatures: list[s
     qb, qq = _baseflow_separation(q)
     qp = q[q >= 0]
 
+    # % Compute all the requested flow percentiles in a single call
+    fp_quantile = {"Cfp2": 0.02, "Cfp10": 0.1, "Cfp50": 0.5, "Cfp90": 0.9}
+    fp_signatures = [s for s in list_signatures if s in fp_quantile]
+    fp_values = {}
+
+    if fp_signatures:
+        try:
+            fp_values = dict(
+                zip(
+                    fp_signatures,
+                    np.quantile(qp, [fp_quantile[s] for s in fp_signatures]),
+                )
+            )
+        except:
+            fp_values = dict.fromkeys(fp_signatures, np.nan)
+
     for signature in list_signatures:
         if signature == "Crc":
             try:
@@ -207,29 +223,8 @@ def _continuous_signatures(p: np.ndarray, q: np.ndarray, list_signatures: list[s
             except:
                 res.append(np.nan)
 
-        if signature == "Cfp2":
-            try:
-                res.append(np.quantile(qp, 0.02))
-            except:
-                res.append(np.nan)
-
-        if signature == "Cfp10":
-            try:
-                res.append(np.quantile(qp, 0.1))
-            except:
-                res.append(np.nan)
-
-        if signature == "Cfp50":
-            try:
-                res.append(np.quantile(qp, 0.5))
-            except:
-                res.append(np.nan)
-
-        if signature == "Cfp90":
-            try:
-                res.append(np.quantile(qp, 0.9))
-            except:
-                res.append(np.nan)
+        if signature in fp_values:
+            res.append(fp_values[signature])
 
     return res
 
@@ -298,15 +293,14 @@ def _event_signatures(
     return res
 
 
-def _signatures_comp(
+def _signatures_obs_data(
     instance: Model,
-    cs: list[str],
     es: list[str],
     peak_quant: float,
     max_duration: float,
-    obs_comp: bool,  # decide if process observation computation or not.
-    warn: bool,
-):
+) -> tuple:
+    # % Observation-only data (precipitation and discharge without missing values,
+    # % flood events) that do not depend on the simulated discharge
     prcp_cvt = (
         instance.input_data.mean_prcp.copy()
         * 0.001
@@ -320,6 +314,36 @@ def _signatures_comp(
         freq=f"{int(instance.setup.dt)}s",
     )
 
+    obs_data = []
+
+    for i in range(instance.mesh.ng):
+        prcp_tmp, qobs_tmp, ratio = _missing_values(
+            prcp_cvt[i, :], instance.input_data.qobs[i, :]
+        )
+
+        if prcp_tmp is not None and len(es) > 0:
+            list_events = _events_grad(
+                prcp_tmp, qobs_tmp, peak_quant, max_duration, instance.setup.dt
+            )
+
+        else:
+            list_events = None
+
+        obs_data.append((prcp_tmp, qobs_tmp, ratio, list_events))
+
+    return date_range, obs_data
+
+
+def _signatures_comp(
+    instance: Model,
+    cs: list[str],
+    es: list[str],
+    peak_quant: float,
+    max_duration: float,
+    obs_comp: bool,  # decide if process observation computation or not.
+    warn: bool,
+    obs_data: tuple | None = None,
+):
     col_cs = ["code"] + cs
     col_es = ["code", "season", "start", "end"] + es
 
@@ -330,10 +354,13 @@ def _signatures_comp(
     dfobs_es = pd.DataFrame(columns=col_es)
 
     if len(cs) + len(es) > 0:
+        if obs_data is None:
+            obs_data = _signatures_obs_data(instance, es, peak_quant, max_duration)
+
+        date_range, catchment_obs_data = obs_data
+
         for i, catchment in enumerate(instance.mesh.code):
-            prcp_tmp, qobs_tmp, ratio = _missing_values(
-                prcp_cvt[i, :], instance.input_data.qobs[i, :]
-            )
+            prcp_tmp, qobs_tmp, ratio, list_events = catchment_obs_data[i]
 
             if prcp_tmp is None:
                 if warn:
@@ -380,10 +407,6 @@ def _signatures_comp(
                         dfobs_cs = pd.concat([dfobs_cs, rowobs_cs], ignore_index=True)
 
                 if len(es) > 0:
-                    list_events = _events_grad(
-                        prcp_tmp, qobs_tmp, peak_quant, max_duration, instance.setup.dt
-                    )
-
                     if len(list_events) == 0:
                         row_es = pd.DataFrame(
                             [[catchment] + [np.nan] * (len(col_es) - 1)],
@@ -489,6 +512,7 @@ def _signatures_sensitivity(
     cs: list[str],
     es: list[str],
     seed: None | int,
+    verbose: bool,
     peak_quant: float = 0.995,
     max_duration: float = 240,
     **unknown_options,
@@ -508,12 +532,23 @@ def _signatures_sensitivity(
     dfs_cs = []  # list of dataframes for CS
     dfs_es = []  # list of dataframes for ES
 
-    for i in tqdm(range(len(sp.samples)), desc="</> Computing signatures sensitivity"):
+    # % The cost is returned in output and forward resets the states at the end of the
+    # % run, so the cost buffer and the states background are allocated once
+    cost = np.float32(0)
+
+    states_bgd = instance.states.copy()
+
+    # % The observation data do not depend on the samples, compute them once
+    obs_data = _signatures_obs_data(instance, es, peak_quant, max_duration)
+
+    for i in tqdm(
+        range(len(sp.samples)),
+        desc="</> Computing signatures sensitivity",
+        disable=not verbose,
+    ):
         for j, name in enumerate(problem["names"]):
             setattr(instance.parameters, name, sp.samples[i, j])
 
-        cost = np.float32(0)
-
         forward(
             instance.setup,
             instance.mesh,
@@ -521,13 +556,20 @@ def _signatures_sensitivity(
             instance.parameters,
             instance.parameters.copy(),
             instance.states,
-            instance.states.copy(),
+            states_bgd,
             instance.output,
             cost,
         )
 
         res_sign = _signatures_comp(
-            instance, cs, es, peak_quant, max_duration, obs_comp=False, warn=(i == 0)
+            instance,
+            cs,
+            es,
+            peak_quant,
+            max_duration,
+            obs_comp=False,
+            warn=(i == 0),
+            obs_data=obs_data,
         )
 
         dfs_cs.append(res_sign.cont["sim"])
@@ -549,10 +591,11 @@ def _signatures_sensitivity(
             total_si = {key: [] for key in problem["names"]}
             first_si = {key: [] for key in problem["names"]}
 
+            # % Stack the signature of all the samples once, (n_sample, n_rows)
+            outputs = np.array([df[name].to_numpy(dtype=np.float64) for df in dfs])
+
             for j in range(len(dfinfo["code"])):
-                y = np.array(
-                    [dfs[i][name].loc[j] for i in range(len(dfs))]
-                )  # signature output
+                y = outputs[:, j]  # signature output
 
                 sp.set_results(y)  # send the output to the SALib interface
 
@@ -712,8 +712,10 @@ def _parameters_states_to_x(instance: Model, control_vector: np.ndarray) -> np.n
 
     x = np.zeros(shape=control_vector.size, dtype=np.float32)
 
+    parameters_name = instance.setup._parameters_name
+
     for ind, name in enumerate(control_vector):
-        if name in instance.setup._parameters_name:
+        if name in parameters_name:
             x[ind] = getattr(instance.parameters, name)[ac_ind]
 
         else:
@@ -735,10 +737,12 @@ def _hyper_parameters_states_to_x(
 
     x = np.zeros(shape=control_vector.size * nd_step, dtype=np.float32)
 
+    parameters_name = instance.setup._parameters_name
+
     for ind, name in enumerate(control_vector):
         lb, ub = bounds[ind, :]
 
-        if name in instance.setup._parameters_name:
+        if name in parameters_name:
             y = getattr(instance.parameters, name)[ac_ind]
 
         else:
@@ -750,28 +754,17 @@ def _hyper_parameters_states_to_x(
 
 
 def _x_to_parameters_states(x: np.ndarray, instance: Model, control_vector: np.ndarray):
+    # % Called at each cost evaluation: get the parameters names and the active cells
+    # % once and write in place in the Fortran arrays (f90wrap getters return views)
+    parameters_name = instance.setup._parameters_name
+    active_cell = instance.mesh.active_cell == 1
+
     for ind, name in enumerate(control_vector):
-        if name in instance.setup._parameters_name:
-            setattr(
-                instance.parameters,
-                name,
-                np.where(
-                    instance.mesh.active_cell == 1,
-                    x[ind],
-                    getattr(instance.parameters, name),
-                ),
-            )
+        if name in parameters_name:
+            getattr(instance.parameters, name)[active_cell] = x[ind]
 
         else:
-            setattr(
-                instance.states,
-                name,
-                np.where(
-                    instance.mesh.active_cell == 1,
-                    x[ind],
-                    getattr(instance.states, name),
-                ),
-            )
+            getattr(instance.states, name)[active_cell] = x[ind]
 
 
 def _x_to_hyper_parameters_states(
@@ -779,6 +772,8 @@ def _x_to_hyper_parameters_states(
 ):
     nd_step = 1 + instance.setup._nd
 
+    parameters_name = instance.setup._parameters_name
+
     for ind, name in enumerate(control_vector):
         value = x[ind * nd_step] * np.ones(
             shape=(instance.mesh.nrow, instance.mesh.ncol), dtype=np.float32
@@ -791,7 +786,7 @@ def _x_to_hyper_parameters_states(
 
         y = (ub - lb) * (1.0 / (1.0 + np.exp(-value))) + lb
 
-        if name in instance.setup._parameters_name:
+        if name in parameters_name:
             setattr(instance.parameters, name, y)
 
         else:
@@ -131,12 +131,12 @@ def _standardize_control_vector(
         else:
             raise TypeError(f"control_vector argument must be str or list-like object")
 
-        for name in control_vector:
-            available = [
-                *STRUCTURE_PARAMETERS[setup.structure],
-                *STRUCTURE_STATES[setup.structure],
-            ]
+        available = [
+            *STRUCTURE_PARAMETERS[setup.structure],
+            *STRUCTURE_STATES[setup.structure],
+        ]
 
+        for name in control_vector:
             if name not in available:
                 raise ValueError(
                     f"Unknown parameter or state '{name}' for structure '{setup.structure}' in control_vector. Choices: {available}"
@@ -208,17 +208,21 @@ def _standardize_bounds(
     # % Default values
     bounds = np.empty(shape=(control_vector.size, 2), dtype=np.float32)
 
+    # % Character arrays are rebuilt by the f90wrap getter at each access, get them once
+    parameters_name = setup._parameters_name
+    states_name = setup._states_name
+
     for i, name in enumerate(control_vector):
-        if name in setup._parameters_name:
-            ind = np.argwhere(setup._parameters_name == name)
+        if name in parameters_name:
+            ind = np.argwhere(parameters_name == name)
 
             bounds[i, :] = (
                 setup._optimize.lb_parameters[ind].item(),
                 setup._optimize.ub_parameters[ind].item(),
             )
 
-        elif name in setup._states_name:
-            ind = np.argwhere(setup._states_name == name)
+        elif name in states_name:
+            ind = np.argwhere(states_name == name)
 
             bounds[i, :] = (
                 setup._optimize.lb_states[ind].item(),
@@ -266,9 +270,7 @@ def _standardize_bounds(
 
         # % Check that parameters and states are inside user bounds
         for i, name in enumerate(control_vector):
-            if name in setup._parameters_name:
-                ind = np.argwhere(setup._parameters_name == name)
-
+            if name in parameters_name:
                 parameters_attr = getattr(parameters, name)
                 if np.any(parameters_attr + 1e-3 < bounds[i, 0]) or np.any(
                     parameters_attr - 1e-3 > bounds[i, 1]
@@ -279,8 +281,6 @@ def _standardize_bounds(
 
             # % Already check, must be states if not parameters
             else:
-                ind = np.argwhere(setup._states_name == name)
-
                 states_attr = getattr(states, name)
                 if np.any(states_attr + 1e-3 < bounds[i, 0]) or np.any(
                     states_attr - 1e-3 > bounds[i, 1]
@@ -301,21 +301,24 @@ def _standardize_gauge(
     mesh: MeshDT,
     input_data: Input_DataDT,
 ) -> np.ndarray:
+    # % Character array attribute is decoded by the f90wrap getter at each access
+    code = mesh.code
+
     if isinstance(gauge, str):
         if gauge == "all":
-            gauge = mesh.code.copy()
+            gauge = code.copy()
 
         elif gauge == "downstream":
             ind = np.argmax(mesh.area)
 
-            gauge = np.array(mesh.code[ind], ndmin=1)
+            gauge = np.array(code[ind], ndmin=1)
 
-        elif gauge in mesh.code:
+        elif gauge in code:
             gauge = np.array(gauge, ndmin=1)
 
         else:
             raise ValueError(
-                f"Unknown gauge alias or code '{gauge}'. Choices: {GAUGE_ALIAS} or {mesh.code}"
+                f"Unknown gauge alias or code '{gauge}'. Choices: {GAUGE_ALIAS} or {code}"
             )
 
     elif isinstance(gauge, (list, tuple)):
@@ -326,11 +329,13 @@ def _standardize_gauge(
 
     gauge_check = np.array([])
 
+    optimize_start_step = setup._optimize.optimize_start_step
+
     for i, name in enumerate(gauge):
-        if name in mesh.code:
-            ind = np.argwhere(mesh.code == name).squeeze()
+        if name in code:
+            ind = np.argwhere(code == name).squeeze()
 
-            if np.all(input_data.qobs[ind, setup._optimize.optimize_start_step :] < 0):
+            if np.all(input_data.qobs[ind, optimize_start_step:] < 0):
                 warnings.warn(
                     f"gauge '{name}' has no available observed discharge. Removed from the optimization"
                 )
@@ -339,7 +344,7 @@ def _standardize_gauge(
                 gauge_check = np.append(gauge_check, gauge[i])
 
         else:
-            raise ValueError(f"Unknown gauge code '{name}'. Choices: {mesh.code}")
+            raise ValueError(f"Unknown gauge code '{name}'. Choices: {code}")
 
     if gauge_check.size == 0:
         raise ValueError(
@@ -355,8 +360,10 @@ def _standardize_gauge(
 def _standardize_wgauge(
     wgauge: str | list | tuple, gauge: np.ndarray, mesh: MeshDT
 ) -> np.ndarray:
-    weight_arr = np.zeros(shape=mesh.code.size, dtype=np.float32)
-    ind = np.in1d(mesh.code, gauge)
+    code = mesh.code
+
+    weight_arr = np.zeros(shape=code.size, dtype=np.float32)
+    ind = np.in1d(code, gauge)
 
     if isinstance(wgauge, str):
         if wgauge == "mean":
@@ -440,6 +447,17 @@ def _standardize_ncpu(ncpu: int) -> int:
     return ncpu
 
 
+def _standardize_qsim_directory(qsim_directory: str | None) -> str | None:
+    if qsim_directory is not None:
+        if not isinstance(qsim_directory, str):
+            raise TypeError("qsim_directory argument must be str")
+
+        elif not os.path.isdir(qsim_directory):
+            raise ValueError(f"qsim_directory '{qsim_directory}' is not a directory")
+
+    return qsim_directory
+
+
 def _standardize_maxiter(maxiter: int) -> int:
     if isinstance(maxiter, int):
         if maxiter < 0:
@@ -809,6 +827,7 @@ def _standardize_multiple_run_args(
     wgauge: str | list | tuple,
     ost: str | pd.Timestamp | None,
     ncpu: int,
+    qsim_directory: str | None,
     instance: Model,
 ):
     reset_optimize_setup(
@@ -833,6 +852,8 @@ def _standardize_multiple_run_args(
 
     ncpu = _standardize_ncpu(ncpu)
 
+    qsim_directory = _standardize_qsim_directory(qsim_directory)
+
     update_optimize_setup_optimize_args(
         instance.setup._optimize,
         "...",
@@ -850,6 +871,7 @@ def _standardize_multiple_run_args(
         wgauge,
         ost,
         ncpu,
+        qsim_directory,
     )
 
 
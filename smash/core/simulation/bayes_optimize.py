@@ -213,19 +213,21 @@ def _run(
 ):
     ### SETTING MODEL TO COMPUTE COST VALUES ###
 
+    # % Called once per sample, bind the derived types to locals
+    setup = instance.setup
+    optimize = setup._optimize
+
     # % send mask_event to Fortran in case of event signatures based optimization
     if any([fn[0] == "E" for fn in jobs_fun]):
-        instance.setup._optimize.mask_event = _mask_event(instance, **event_seg)
+        optimize.mask_event = _mask_event(instance, **event_seg)
 
     # % Set values for Fortran derived type variables
-    instance.setup._optimize.jobs_fun = jobs_fun
-    instance.setup._optimize.wjobs_fun = wjobs_fun
-    instance.setup._optimize.wgauge = wgauge
+    optimize.jobs_fun = jobs_fun
+    optimize.wjobs_fun = wjobs_fun
+    optimize.wgauge = wgauge
 
-    st = pd.Timestamp(instance.setup.start_time)
-    instance.setup._optimize.optimize_start_step = (
-        ost - st
-    ).total_seconds() / instance.setup.dt + 1
+    st = pd.Timestamp(setup.start_time)
+    optimize.optimize_start_step = (ost - st).total_seconds() / setup.dt + 1
 
     ###
 
@@ -233,14 +235,17 @@ def _run(
 
     cost = np.float32(0)
 
+    parameters = instance.parameters
+    states = instance.states
+
     forward(
-        instance.setup,
+        setup,
         instance.mesh,
         instance.input_data,
-        instance.parameters,
-        instance.parameters.copy(),
-        instance.states,
-        instance.states.copy(),
+        parameters,
+        parameters.copy(),
+        states,
+        states.copy(),
         instance.output,
         cost,
     )
@@ -260,9 +265,13 @@ def _unit_simu(
     ost: pd.Timestamp,
     options: dict | None,
 ) -> dict:
+    # % Character arrays are rebuilt by the f90wrap getter at each access, get it once
+    parameters_name = instance.setup._parameters_name
+    names = sample._problem["names"]
+
     # % SET PARAMS/STATES
-    for name in sample._problem["names"]:
-        if name in instance.setup._parameters_name:
+    for name in names:
+        if name in parameters_name:
             setattr(instance.parameters, name, getattr(sample, name)[i])
 
         else:
@@ -275,7 +284,7 @@ def _unit_simu(
     else:
         OPTIM_FUNC[algorithm](
             instance,
-            sample._problem["names"],
+            names,
             mapping,
             jobs_fun,
             wjobs_fun,
@@ -291,8 +300,8 @@ def _unit_simu(
 
     res["cost"] = instance.output.cost
 
-    for name in sample._problem["names"]:
-        if name in instance.setup._parameters_name:
+    for name in names:
+        if name in parameters_name:
             res[name] = np.copy(
                 getattr(instance.parameters, name)
             )  # must be copy here (TODO: change in V1.0.0)
@@ -305,6 +314,20 @@ def _unit_simu(
     return res
 
 
+_worker_args = ()
+
+
+def _init_worker(*args):
+    global _worker_args
+
+    _worker_args = args
+
+
+def _worker_unit_simu(i: int) -> dict:
+    # % Each worker process owns its forked copy of the Model
+    return _unit_simu(i, *_worker_args)
+
+
 def _multi_simu(
     instance: Model,
     sample: SampleResult,
@@ -326,28 +349,28 @@ def _multi_simu(
         pgbar_mess = "</> Optimizing Model parameters on multiset"
 
     if ncpu > 1:
-        list_instance = [instance.copy() for i in range(sample.n_sample)]
-
-        pool = mp.Pool(ncpu)
-        list_result = pool.starmap(
-            _unit_simu,
-            [
-                (
-                    i,
-                    instance,
-                    sample,
-                    algorithm,
-                    mapping,
-                    jobs_fun,
-                    wjobs_fun,
-                    event_seg,
-                    bounds,
-                    wgauge,
-                    ost,
-                    options,
-                )
-                for i, instance in tqdm(enumerate(list_instance), desc=pgbar_mess)
-            ],
+        # % The workers inherit the Model and the fixed arguments when forking,
+        # % so that neither one Model copy per sample nor the sample itself
+        # % has to be created and pickled for each task
+        pool = mp.Pool(
+            ncpu,
+            initializer=_init_worker,
+            initargs=(
+                instance,
+                sample,
+                algorithm,
+                mapping,
+                jobs_fun,
+                wjobs_fun,
+                event_seg,
+                bounds,
+                wgauge,
+                ost,
+                options,
+            ),
+        )
+        list_result = pool.map(
+            _worker_unit_simu, tqdm(range(sample.n_sample), desc=pgbar_mess)
         )
         pool.close()
 
@@ -431,23 +454,35 @@ def _compute_density(
 
 
 def _compute_mean_U(
-    U: np.ndarray, J: np.ndarray, rho: np.ndarray, alpha: float, mask: np.ndarray
+    U: np.ndarray,
+    J: np.ndarray,
+    rho: np.ndarray,
+    alpha: float,
+    mask: np.ndarray,
+    Uinf: np.ndarray | None = None,
 ) -> tuple:
     # U is 3-D array
     # rho is 3-D array
     # J is 1-D array
+    # Uinf is 2-D array, does not depend on alpha (can be precomputed for L-curve)
 
-    L = np.exp(-(2**alpha) * (J / min(J) - 1) ** 2)  # likelihood
+    L = np.exp(-(2**alpha) * (J / np.min(J) - 1) ** 2)  # likelihood
     Lrho = L * rho  # 3-D array
 
     C = np.sum(Lrho, axis=2)  # C is 2-D array
 
-    U_alp = 1 / C * np.sum(U * Lrho, axis=2)  # 2-D array
+    # % Reuse a single 3-D buffer for the weighted terms
+    buf = U * Lrho
+    U_alp = 1 / C * np.sum(buf, axis=2)  # 2-D array
 
-    varU = 1 / C * np.sum((U - U_alp[..., np.newaxis]) ** 2 * Lrho, axis=2)  # 2-D array
+    np.subtract(U, U_alp[..., np.newaxis], out=buf)
+    np.square(buf, out=buf)
+    buf *= Lrho
+    varU = 1 / C * np.sum(buf, axis=2)  # 2-D array
     varU = np.mean(varU[mask])
 
-    Uinf = np.mean(U, axis=2)  # 2-D array
+    if Uinf is None:
+        Uinf = np.mean(U, axis=2)  # 2-D array
 
     D_alp = np.mean(np.square(U_alp - Uinf)[mask]) / varU
 
@@ -466,17 +501,25 @@ def _compute_param(
     prior_data: dict,
     density: dict,
     alpha: int | float,
+    prior_mean: dict | None = None,
 ) -> tuple:
     D_alp = []
 
     var = {}
 
+    parameters_name = instance.setup._parameters_name
+
     for name in sample._problem["names"]:
         u, v, d = _compute_mean_U(
-            prior_data[name], prior_data["cost"], density[name], alpha, active_mask
+            prior_data[name],
+            prior_data["cost"],
+            density[name],
+            alpha,
+            active_mask,
+            None if prior_mean is None else prior_mean[name],
         )
 
-        if name in instance.setup._parameters_name:
+        if name in parameters_name:
             setattr(instance.parameters, name, u)
 
         else:
@@ -516,6 +559,11 @@ def _lcurve_compute_param(
     D_alp = []
     var = []
 
+    # % Mean of the prior solution, common to all alpha values
+    prior_mean = {
+        name: np.mean(prior_data[name], axis=2) for name in sample._problem["names"]
+    }
+
     for alpha_i in alpha:
         co, d_alp, vr = _compute_param(
             instance,
@@ -529,6 +577,7 @@ def _lcurve_compute_param(
             prior_data,
             density,
             alpha_i,
+            prior_mean,
         )
 
         cost.append(co)
@@ -554,6 +603,7 @@ def _lcurve_compute_param(
         prior_data,
         density,
         alpha_opt,
+        prior_mean,
     )
 
     ret_lcurve["alpha"] = alpha
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 
 import numpy as np
 import pandas as pd
+import tempfile
 
 __all__ = ["MultipleRunResult"]
 
@@ -100,16 +101,19 @@ def _get_ind_parameters_states(instance: Model, sample: SampleResult) -> np.ndar
     ind_parameters_states = np.zeros(
         shape=sample._problem["num_vars"], dtype=np.int32, order="F"
     )
-    n_parameters = instance.setup._parameters_name.size
+    # % Character arrays are rebuilt by the f90wrap getter at each access, get them once
+    parameters_name = instance.setup._parameters_name
+    states_name = instance.setup._states_name
+    n_parameters = parameters_name.size
 
     for i, name in enumerate(sample._problem["names"]):
-        if name in instance.setup._parameters_name:
-            ind = np.argwhere(instance.setup._parameters_name == name)
+        if name in parameters_name:
+            ind = np.argwhere(parameters_name == name)
             # % Transform Python to Fortran index
             ind_parameters_states[i] = ind + 1
         # % Already check, must be states if not parameters
         else:
-            ind = np.argwhere(instance.setup._states_name == name)
+            ind = np.argwhere(states_name == name)
             # % Transform Python to Fortran index
             ind_parameters_states[i] = n_parameters + ind + 1
 
@@ -155,6 +159,7 @@ def _multiple_run(
     ost: pd.Timestamp,
     ncpu: int,
     return_qsim: bool,
+    qsim_directory: str | None,
     verbose: bool,
 ):
     instance.setup._ncpu = ncpu
@@ -185,17 +190,42 @@ def _multiple_run(
     )
 
     if return_qsim:
-        res_qsim = np.zeros(
-            shape=(instance.mesh.ng, instance.setup._ntime_step, sample.n_sample),
-            dtype=np.float32,
-            order="F",
-        )
+        shape = (instance.mesh.ng, instance.setup._ntime_step, sample.n_sample)
+
+        # % On request, back the result by an anonymous temporary file in qsim_directory
+        # % so that the OS can page it out instead of holding it resident
+        if qsim_directory is not None:
+            res_qsim = np.memmap(
+                tempfile.TemporaryFile(dir=qsim_directory),
+                dtype=np.float32,
+                mode="w+",
+                shape=shape,
+                order="F",
+            )
+
+        else:
+            res_qsim = np.zeros(
+                shape=shape,
+                dtype=np.float32,
+                order="F",
+            )
     else:
         res_qsim = np.empty(
             shape=3 * (0,),
             dtype=np.float32,
             order="F",
         )
+    # % Fill the samples once as real(sp) Fortran array, avoiding the float64 stack
+    # % followed by the f90wrap cast and copy of sample.to_numpy()
+    samples = np.empty(
+        shape=(len(sample._problem["names"]), sample.n_sample),
+        dtype=np.float32,
+        order="F",
+    )
+
+    for i, name in enumerate(sample._problem["names"]):
+        samples[i, :] = sample[name]
+
     if verbose:
         _multiple_run_message(instance, sample)
 
@@ -206,7 +236,7 @@ def _multiple_run(
         instance.parameters,
         instance.states,
         instance.output,
-        sample.to_numpy(),
+        samples,
         ind_parameters_states,
         res_cost,
         res_qsim,
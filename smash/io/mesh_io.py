@@ -4,6 +4,8 @@ from smash.io._error import ReadHDF5MethodError
 
 import os
 import errno
+import copy
+import functools
 import h5py
 import numpy as np
 
@@ -58,6 +60,18 @@ def _parse_hdf5_to_mesh_dict(hdf5_ins) -> dict:
     return mesh
 
 
+# % Read meshes, keyed by absolute path and file stat (a modified file is read again)
+# % and bounded to the few most recently read meshes (None if not saved by save_mesh)
+@functools.lru_cache(maxsize=4)
+def _load_mesh(abs_path: str, mtime_ns: int, size: int) -> dict | None:
+    with h5py.File(abs_path, "r") as f:
+        if f.attrs.get("_save_func") == "save_mesh":
+            return _parse_hdf5_to_mesh_dict(f)
+
+        else:
+            return None
+
+
 def save_mesh(mesh: dict, path: str):
     """
     Save Model initialization mesh dictionary.
@@ -141,14 +155,18 @@ def read_mesh(path: str) -> dict:
     """
 
     if os.path.isfile(path):
-        with h5py.File(path, "r") as f:
-            if f.attrs.get("_save_func") == "save_mesh":
-                return _parse_hdf5_to_mesh_dict(f)
-
-            else:
-                raise ReadHDF5MethodError(
-                    f"Unable to read '{path}' with 'read_mesh' method. The file may not have been created with 'save_mesh' method."
-                )
+        abs_path = os.path.abspath(path)
+        st = os.stat(abs_path)
+
+        mesh = _load_mesh(abs_path, st.st_mtime_ns, st.st_size)
+
+        if mesh is None:
+            raise ReadHDF5MethodError(
+                f"Unable to read '{path}' with 'read_mesh' method. The file may not have been created with 'save_mesh' method."
+            )
+
+        # % Return a copy so that modifying the mesh does not alter the cache
+        return copy.deepcopy(mesh)
 
     else:
         raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
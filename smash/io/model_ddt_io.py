@@ -38,6 +38,33 @@ def _default_save_data(structure: str):
     }
 
 
+# % Arrays smaller than this size (in bytes) are stored contiguous and uncompressed,
+# % larger ones are gzip compressed (available in any HDF5 build, unlike LZF)
+_CONTIGUOUS_MAX_NBYTES = 64 * 1024
+
+
+def _create_dataset(hdf5_ins, name: str, value: np.ndarray):
+    if value.nbytes < _CONTIGUOUS_MAX_NBYTES:
+        hdf5_ins.create_dataset(
+            name,
+            shape=value.shape,
+            dtype=value.dtype,
+            data=value,
+        )
+
+    else:
+        hdf5_ins.create_dataset(
+            name,
+            shape=value.shape,
+            dtype=value.dtype,
+            data=value,
+            compression="gzip",
+            # % Byte shuffling improves compression of correlated float series
+            shuffle=np.issubdtype(value.dtype, np.floating),
+            chunks=True,
+        )
+
+
 def _parse_selected_derived_type_to_hdf5(
     derived_type, list_attr, hdf5_ins, attr_suffix=""
 ):
@@ -54,14 +81,7 @@ def _parse_selected_derived_type_to_hdf5(
                     if value.dtype == "object" or value.dtype.char == "U":
                         value = value.astype("S")
 
-                    hdf5_ins.create_dataset(
-                        attr,
-                        shape=value.shape,
-                        dtype=value.dtype,
-                        data=value,
-                        compression="gzip",
-                        chunks=True,
-                    )
+                    _create_dataset(hdf5_ins, attr, value)
 
                 else:
                     hdf5_ins.attrs[attr] = value
@@ -168,14 +188,7 @@ def save_model_ddt(model: Model, path: str, sub_data=None, sub_only=False):
                         value = value.astype("S")
 
                     try:
-                        f.create_dataset(
-                            attr,
-                            shape=value.shape,
-                            dtype=value.dtype,
-                            data=value,
-                            compression="gzip",
-                            chunks=True,
-                        )
+                        _create_dataset(f, attr, value)
 
                     except:
                         warnings.warn(f"Can not store to HDF5: {attr}")
@@ -246,10 +259,16 @@ def read_model_ddt(path: str) -> dict:
             if f.attrs.get("_save_func") == "save_model_ddt":
                 keys = list(f.keys())
 
-                values = [
-                    f[key][:].astype("U") if f[key][:].dtype.char == "S" else f[key][:]
-                    for key in keys
-                ]
+                values = []
+
+                # % Read each dataset once and decode byte strings afterwards
+                for key in keys:
+                    value = f[key][:]
+
+                    if value.dtype.char == "S":
+                        value = value.astype("U")
+
+                    values.append(value)
 
                 attr_keys = list(f.attrs.keys())
 
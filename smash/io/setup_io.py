@@ -3,10 +3,27 @@ from __future__ import annotations
 import yaml
 import os
 import errno
+import copy
+import functools
+
+# % Use the libyaml based loader when PyYAML has been built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+
+except ImportError:
+    from yaml import SafeLoader
 
 __all__ = ["save_setup", "read_setup"]
 
 
+# % Parsed setups, keyed by absolute path and file stat (a modified file is read again)
+# % and bounded to the most recently read setups
+@functools.lru_cache(maxsize=32)
+def _load_setup(abs_path: str, mtime_ns: int, size: int) -> dict:
+    with open(abs_path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
 def save_setup(setup: dict, path: str):
     """
     Save Model initialization setup dictionary.
@@ -83,8 +100,11 @@ def read_setup(path: str) -> dict:
     """
 
     if os.path.isfile(path):
-        with open(path, "r") as f:
-            setup = yaml.safe_load(f)
+        abs_path = os.path.abspath(path)
+        st = os.stat(abs_path)
+
+        # % Return a copy so that modifying the setup does not alter the cache
+        setup = copy.deepcopy(_load_setup(abs_path, st.st_mtime_ns, st.st_size))
 
     else:
         raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
@@ -214,12 +214,13 @@ def _standardize_bbox(ds_flwdir, bbox):
 
 
 def _get_path(flwacc):
-    ind_path = np.unravel_index(np.argsort(flwacc, axis=None), flwacc.shape)
+    # % Cast once to the Fortran int32 path dtype so divmod needs no buffered cast
+    ind_path = np.argsort(flwacc, axis=None).astype(np.int32, copy=False)
 
     path = np.zeros(shape=(2, flwacc.size), dtype=np.int32, order="F")
 
-    path[0, :] = ind_path[0]
-    path[1, :] = ind_path[1]
+    # % Flat index to (row, col) written in place in path rows
+    np.divmod(ind_path, flwacc.shape[1], out=(path[0, :], path[1, :]))
 
     return path
 
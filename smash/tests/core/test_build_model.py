@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from smash.core._build_model import _build_day_index
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.mark.parametrize("unit", ["ns", "us", "ms", "s"])
+def test_build_day_index(unit):
+    # % Non nanosecond units are only available with pandas >= 2
+    if not hasattr(pd.DatetimeIndex, "as_unit"):
+        pytest.skip("DatetimeIndex.as_unit requires pandas >= 2")
+
+    date_range = pd.date_range(
+        start="2014-09-15 00:00", end="2014-11-14 00:00", freq="3600s"
+    )[1:]
+
+    # % Day index computed from the date strings, one step at a time
+    date_strf = date_range.strftime("%Y%m%d")
+
+    n = 1
+    day_index = np.ones(shape=len(date_strf), dtype=np.int64)
+    for i in range(1, len(date_strf)):
+        if date_strf[i] != date_strf[i - 1]:
+            n += 1
+
+        day_index[i] = n
+
+    # % Check that the day index does not depend on the time unit of the index
+    assert np.array_equal(
+        _build_day_index(date_range.as_unit(unit)), day_index
+    ), f"build_day_index.{unit}"
@@ -22,7 +22,10 @@ def generic_gen_samples(model: smash.Model, **kwargs) -> dict:
     )
     nor = sample.to_numpy(axis=-1)
 
-    res = {"gen_samples.uni": uni, "gen_samples.nor": nor}
+    sample = smash.generate_samples(problem, generator="lhs", n=20, random_state=11)
+    lhs = sample.to_numpy(axis=-1)
+
+    res = {"gen_samples.uni": uni, "gen_samples.nor": nor, "gen_samples.lhs": lhs}
 
     return res
 
@@ -31,5 +34,31 @@ def test_gen_samples():
     res = generic_gen_samples(pytest.model)
 
     for key, value in res.items():
-        # % Check generate samples uniform/normal
+        # % Check generate samples uniform/normal/lhs
         assert np.allclose(value, pytest.baseline[key][:], atol=1e-06), key
+
+
+def test_gen_samples_lhs():
+    problem = pytest.model.get_bound_constraints()
+
+    n = 20
+
+    sample = smash.generate_samples(problem, generator="lhs", n=n, random_state=11)
+    lhs = sample.to_numpy()
+
+    bounds = np.asarray(problem["bounds"], dtype=np.float64)
+    low = bounds[:, 0, np.newaxis]
+    upp = bounds[:, 1, np.newaxis]
+
+    # % Check that the samples are within the bounds
+    assert np.all((lhs >= low) & (lhs <= upp)), "gen_samples_lhs.bounds"
+
+    # % Check that the samples are reproducible with the same random state
+    sample = smash.generate_samples(problem, generator="lhs", n=n, random_state=11)
+
+    assert np.array_equal(lhs, sample.to_numpy()), "gen_samples_lhs.random_state"
+
+    # % Check that each of the n strata holds exactly one sample in every dimension
+    strata = np.floor((lhs - low) / (upp - low) * n).astype(int)
+
+    assert np.all(np.sort(strata, axis=1) == np.arange(n)), "gen_samples_lhs.strata"
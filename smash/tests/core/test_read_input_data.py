@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import smash
+
+from smash.tools.raster_handler import gdal_raster_open, gdal_crop_dataset_to_array
+
+from osgeo import gdal
+import os
+import shutil
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def test_read_qobs_nan():
+    setup, mesh = smash.load_dataset("Cance")
+
+    qobs_directory = "tmp_qobs"
+
+    if os.path.exists(qobs_directory):
+        shutil.rmtree(qobs_directory)
+
+    shutil.copytree(setup["qobs_directory"], qobs_directory)
+
+    setup.update(
+        {
+            "qobs_directory": qobs_directory,
+            "read_prcp": False,
+            "read_pet": False,
+            "read_descriptor": False,
+        }
+    )
+
+    # % Replace an observation in the simulated period by a literal nan value
+    ind_gauge = 0
+    ind_time = 100
+
+    path = os.path.join(qobs_directory, f"{mesh['code'][ind_gauge]}.csv")
+
+    with open(path, "r") as f:
+        lines = f.readlines()
+
+    time_diff = (
+        int(
+            (pd.Timestamp(setup["start_time"]) - pd.Timestamp(lines[0])).total_seconds()
+            / setup["dt"]
+        )
+        + 1
+    )
+
+    lines[1 + time_diff + ind_time] = "nan\n"
+
+    with open(path, "w") as f:
+        f.writelines(lines)
+
+    model = smash.Model(setup, mesh)
+
+    qobs = model.input_data.qobs
+    qobs_ref = pytest.model.input_data.qobs
+
+    # % Check that the nan value is stored and that reading goes on after it
+    assert np.isnan(qobs[ind_gauge, ind_time]), "read_qobs.nan"
+
+    mask = np.ones(qobs.shape, dtype=bool)
+    mask[ind_gauge, ind_time] = False
+
+    assert np.array_equal(qobs[mask], qobs_ref[mask]), "read_qobs.after_nan"
+
+    shutil.rmtree(qobs_directory)
+
+
+def test_read_raster_nodata():
+    # % Float32 raster with a nodata value that is not exactly representable in float32
+    nodata = -3.39999999999999996e38
+
+    arr = np.arange(12, dtype=np.float32).reshape(3, 4)
+    arr[0, 1] = nodata
+    arr[2, 3] = nodata
+
+    driver = gdal.GetDriverByName("GTiff")
+    dataset = driver.Create("tmp_raster.tif", 4, 3, 1, gdal.GDT_Float32)
+    dataset.SetGeoTransform((0.0, 1.0, 0.0, 3.0, 0.0, -1.0))
+    band = dataset.GetRasterBand(1)
+    band.SetNoDataValue(nodata)
+    band.WriteArray(arr)
+    band = None
+    dataset = None
+
+    dataset = gdal_raster_open("tmp_raster.tif")
+
+    window = {"row_off": 0, "col_off": 0, "nrow": 3, "ncol": 4}
+
+    value = gdal_crop_dataset_to_array(dataset, window, band=1, lacuna=-99.0)
+
+    dataset = None
+
+    mask = arr == np.float32(nodata)
+
+    # % Check that nodata cells are replaced by lacuna and that other cells are kept
+    assert value.dtype == np.float64, "read_raster_nodata.dtype"
+    assert np.all(value[mask] == -99.0), "read_raster_nodata.lacuna"
+    assert np.array_equal(value[~mask], arr[~mask]), "read_raster_nodata.values"
+
+    os.remove("tmp_raster.tif")
@@ -5,6 +5,7 @@ import smash
 from smash.solver._mwd_cost import nse, kge
 from smash.core._constant import MAPPING
 
+import os
 import numpy as np
 import pytest
 
@@ -58,20 +59,33 @@ def test_multiple_run():
     sample = smash.generate_samples(problem, n=5, random_state=99)
     instance = pytest.model.copy()
 
-    for slc in sample.iterslice():
+    # % Run all the samples at once and compare each of them to a forward run
+    mtprr = pytest.model.multiple_run(sample, return_qsim=True, verbose=False)
+
+    for i, slc in enumerate(sample.iterslice()):
         for key in problem["names"]:
             setattr(instance.parameters, key, slc[key].item())
 
         instance.optimize(options={"maxiter": 0}, inplace=True, verbose=False)
-        mtprr = pytest.model.multiple_run(slc, return_qsim=True, verbose=False)
         assert np.allclose(
-            instance.output.cost, mtprr.cost.item(), atol=1e-04
+            instance.output.cost, mtprr.cost[i], atol=1e-04
         ), "multiple_run.compare_run.cost"
 
         assert np.allclose(
-            instance.output.qsim, mtprr.qsim.squeeze(), atol=1e-04
+            instance.output.qsim, mtprr.qsim[..., i], atol=1e-04
         ), "multiple_run.compare_run.qsim"
 
+    # % Check that the simulated discharge is an in memory array by default and a
+    # % memmap with the same values when a directory is given
+    assert not isinstance(mtprr.qsim, np.memmap), "multiple_run.qsim_ndarray"
+
+    mtprr_mm = pytest.model.multiple_run(
+        sample, return_qsim=True, qsim_directory=os.getcwd(), verbose=False
+    )
+
+    assert isinstance(mtprr_mm.qsim, np.memmap), "multiple_run.qsim_memmap"
+    assert np.array_equal(mtprr_mm.qsim, mtprr.qsim), "multiple_run.qsim_directory"
+
 
 def generic_optimize(model: smash.Model, **kwargs) -> dict:
     res = {}
@@ -121,7 +135,7 @@ def generic_optimize(model: smash.Model, **kwargs) -> dict:
     instance = model.optimize(
         control_vector=["cp", "hlr"], options={"maxiter": 1}, verbose=False
     )
-    model.states.hlr = tmp.copy()
+    model.states.hlr = tmp
 
     res["optimize.uniform_sbs_states.cost"] = output_cost(instance)
     res["optimize.uniform_sbs_states.hlr"] = instance.states.hlr.copy()
@@ -185,7 +199,8 @@ def test_optimize():
     # % (case of spatially distributed prior only)
     # % Does not need a baseline. Should work like this in any case
     tmp = pytest.model.parameters.cft.copy()
-    pytest.model.parameters.cft = np.random.rand(*tmp.shape) + 500
+    rng = np.random.default_rng(11)
+    pytest.model.parameters.cft = rng.random(tmp.shape) + 500
 
     instance = pytest.model.optimize(
         control_vector="cp", options={"maxiter": 1}, verbose=False
@@ -195,7 +210,7 @@ def test_optimize():
         pytest.model.parameters.cft, instance.parameters.cft
     ), "optimize.uniform_sbs_sdp.cft"
 
-    pytest.model.parameters.cft = tmp.copy()
+    pytest.model.parameters.cft = tmp
 
 
 def generic_bayes_estimate(model: smash.Model, **kwargs) -> dict:
@@ -320,15 +335,13 @@ def output_cost(instance: smash.Model):
     qo = instance.input_data.qobs
     qs = instance.output.qsim
 
-    n_jtest = 3
+    # % One row per gauge (cost, nse, kge), flattened row by row
+    ret = np.zeros(shape=(instance.mesh.ng, 3), dtype=np.float32)
 
-    ret = np.zeros(shape=n_jtest * instance.mesh.ng, dtype=np.float32)
+    ret[:, 0] = instance.output.cost
 
     for i in range(instance.mesh.ng):
-        ret[n_jtest * i : n_jtest * (i + 1)] = (
-            instance.output.cost,
-            nse(qo[i], qs[i]),
-            kge(qo[i], qs[i]),
-        )
+        ret[i, 1] = nse(qo[i], qs[i])
+        ret[i, 2] = kge(qo[i], qs[i])
 
-    return np.array(ret)
+    return ret.ravel()
@@ -36,3 +36,50 @@ def test_mesh_io():
     # % Check ReadHDF5MethodError
     with pytest.raises(ReadHDF5MethodError):
         smash.read_mesh("tmp_model_ddt.hdf5")
+
+
+def test_setup_io_reread():
+    setup, mesh = smash.load_dataset("Cance")
+
+    smash.save_setup(setup, "tmp_setup.yaml")
+
+    setup_rld = smash.read_setup("tmp_setup.yaml")
+
+    # % Modify the setup read back, it must not alter the next read
+    setup_rld["dt"] = 0
+
+    assert smash.read_setup("tmp_setup.yaml")["dt"] == setup["dt"], "setup_io.copy"
+
+    # % Edit the file, it must be read again
+    setup["dt"] = 86_400
+
+    smash.save_setup(setup, "tmp_setup.yaml")
+
+    assert smash.read_setup("tmp_setup.yaml")["dt"] == 86_400, "setup_io.reread"
+
+
+def test_mesh_io_reread():
+    setup, mesh = smash.load_dataset("Cance")
+
+    smash.save_mesh(mesh, "tmp_mesh.hdf5")
+
+    mesh_rld = smash.read_mesh("tmp_mesh.hdf5")
+
+    # % Modify the mesh read back, it must not alter the next read
+    mesh_rld["flwdir"][:] = 0
+
+    assert np.array_equal(
+        smash.read_mesh("tmp_mesh.hdf5")["flwdir"], mesh["flwdir"]
+    ), "mesh_io.copy"
+
+    # % Edit the file, it must be read again
+    mesh["dx"] = 2 * mesh["dx"]
+
+    smash.save_mesh(mesh, "tmp_mesh.hdf5")
+
+    # % The file size is unchanged, make sure that the modification time differs
+    # % from the previous read (coarse file system timestamps)
+    st = os.stat("tmp_mesh.hdf5")
+    os.utime("tmp_mesh.hdf5", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    assert smash.read_mesh("tmp_mesh.hdf5")["dx"] == mesh["dx"], "mesh_io.reread"
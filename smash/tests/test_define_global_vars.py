@@ -9,6 +9,6 @@ import os
 setup, mesh = smash.load_dataset("Cance")
 pytest.model = smash.Model(setup, mesh)
 
-pytest.baseline = h5py.File(
-    os.path.join(os.path.dirname(__file__), "baseline.hdf5"), "r"
-)
+# % Load the whole baseline in memory once instead of reading the file at each assertion
+with h5py.File(os.path.join(os.path.dirname(__file__), "baseline.hdf5"), "r") as f:
+    pytest.baseline = {key: f[key][:] for key in f.keys()}
@@ -209,8 +209,13 @@ def gdal_crop_dataset_to_array(dataset=object(), window={}, band=1, lacuna=None)
     # Lacuna treatment here
     if isinstance(lacuna, float):
         nodata = dataset_band.GetNoDataValue()
-        mask = np.where(sliced_array == nodata)
-        array_float[mask] = lacuna
+
+        # % The nodata value is stored as a double, compare it in the band precision
+        # % (e.g. a float32 nodata value may not be exactly representable in float32)
+        if nodata is not None and np.issubdtype(sliced_array.dtype, np.floating):
+            nodata = sliced_array.dtype.type(nodata)
+
+        array_float[sliced_array == nodata] = lacuna
 
     return array_float
 